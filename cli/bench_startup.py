@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark
+
+Measures how long `dfcloud config` commands take to start, using
+`python -X importtime` to break the import cost down by module, and fails
+if a heavy dependency is imported at startup or the budget is exceeded.
+
+Interpreter and disk speed vary a lot between machines, so the budget is
+the time a command takes on top of a bare `import click, yaml`, measured
+in the same run. Those two are the CLI's only startup dependencies.
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --runs 30 --budget-ms 30 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Modules that must only be imported by the commands that need them
+HEAVY_MODULES = ["google.cloud", "google.oauth2", "google.auth", "grpc", "requests", "rich"]
+
+# Startup floor: the interpreter plus the CLI's own dependencies
+FLOOR_COMMAND = ["-c", "import click, yaml"]
+
+COMMANDS = [
+    ["config", "get", "project_id"],
+    ["config", "set", "project_id", "bench-project"],
+]
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse -X importtime output into {module: cumulative microseconds}."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def run_command(
+    args: list[str], env: dict, importtime: bool = False
+) -> subprocess.CompletedProcess:
+    """Run a dfcloud command in a fresh interpreter."""
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-m", "dfcloud.cli", *args]
+    return subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+
+
+def time_run(cmd: list[str], env: dict) -> float:
+    """Time one execution of a command in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dfcloud startup time")
+    parser.add_argument("--runs", type=int, default=15, help="Runs per command")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50,
+        help="Median time allowed on top of importing click and yaml",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to show")
+    args = parser.parse_args()
+
+    # Use a throwaway HOME so the benchmark never touches the real config
+    home = tempfile.mkdtemp(prefix="dfcloud-bench-")
+    env = dict(os.environ, HOME=home, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    # Installed CLIs run from cached bytecode, so let the warm-up run write it
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    # Warm the bytecode cache so the first run isn't an outlier
+    run_command(COMMANDS[0], env)
+
+    failed = False
+
+    result = run_command(COMMANDS[0], env, importtime=True)
+    modules = parse_importtime(result.stderr)
+    top_level = {name: us for name, us in modules.items() if "." not in name}
+    print(f"Slowest top-level imports for `dfcloud {' '.join(COMMANDS[0])}`:")
+    for name, us in sorted(top_level.items(), key=lambda x: x[1], reverse=True)[: args.top]:
+        print(f"  {us / 1000:>8.1f} ms  {name}")
+
+    heavy = sorted(
+        name
+        for name in modules
+        if any(name == h or name.startswith(h + ".") for h in HEAVY_MODULES)
+    )
+    if heavy:
+        failed = True
+        print(f"\nHeavy modules imported at startup: {', '.join(heavy[:10])}")
+
+    # Alternate the floor and the commands so drift in machine load hits both alike
+    floor_timings = []
+    timings = {i: [] for i in range(len(COMMANDS))}
+    overheads = {i: [] for i in range(len(COMMANDS))}
+    for _ in range(args.runs):
+        floor = time_run([sys.executable, *FLOOR_COMMAND], env)
+        floor_timings.append(floor)
+        for i, command in enumerate(COMMANDS):
+            elapsed = time_run([sys.executable, "-m", "dfcloud.cli", *command], env)
+            timings[i].append(elapsed)
+            overheads[i].append(elapsed - floor)
+
+    print(f"\n{'command':<40}  {'median':>8}  {'max':>8}  {'over floor':>10}")
+    floor = statistics.median(floor_timings)
+    print(f"{'(import click, yaml)':<40}  {floor:>6.1f}ms  {max(floor_timings):>6.1f}ms")
+    for i, command in enumerate(COMMANDS):
+        median = statistics.median(timings[i])
+        overhead = statistics.median(overheads[i])
+        print(
+            f"{' '.join(command):<40}  {median:>6.1f}ms  {max(timings[i]):>6.1f}ms"
+            f"  {overhead:>8.1f}ms"
+        )
+        if overhead > args.budget_ms:
+            failed = True
+
+    if failed:
+        print(
+            f"\nFAIL: budget is {args.budget_ms:.0f} ms over the click/yaml floor "
+            "with no heavy imports"
+        )
+        sys.exit(1)
+    print(f"\nOK: within {args.budget_ms:.0f} ms of the click/yaml floor")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,41 +12,159 @@ Commands:
     init     - Initialize Spin service with tool schema and mock data
 """
 
+from __future__ import annotations
+
+import base64
+import hashlib
 import json
 import os
+import re
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import requests
 import yaml
-from google.auth.transport.requests import Request
-from google.cloud import run_v2, storage
-from google.oauth2 import id_token
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+# Google Cloud clients, requests and rich take hundreds of milliseconds to
+# import, so commands import what they use. Config commands print with click
+# so they never load rich at all.
+if TYPE_CHECKING:
+    import requests
+
+
+_consoles = {}
+
+
+def get_console(stderr: bool = False):
+    """Get the shared rich Console for stdout or stderr, importing rich on first use."""
+    if stderr not in _consoles:
+        from rich.console import Console
+
+        _consoles[stderr] = Console(stderr=stderr)
+    return _consoles[stderr]
+
+
+class LazyConsole:
+    """Stand-in for a rich Console that imports rich on first use."""
+
+    def __init__(self, stderr: bool = False):
+        self.stderr = stderr
+
+    def __getattr__(self, name):
+        return getattr(get_console(self.stderr), name)
+
+
+console = LazyConsole()
+
+# Notices that shouldn't mix into output meant for piping, such as logs
+err_console = LazyConsole(stderr=True)
 
 # Default config location
 CONFIG_DIR = Path.home() / ".dfcloud"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Per-directory record of downloaded blobs, used to skip unchanged files
+DOWNLOAD_MANIFEST = ".dfcloud-manifest.json"
+
+# Files larger than this are downloaded as concurrent byte ranges
+SLICED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+SLICED_DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Working folders inside a run: dataset checkpoint chunks and per-shard outputs.
+# Their data is also in the run's final files, so downloads skip them by default.
+RUN_PARTS_FOLDERS = ("checkpoint", "shards")
+
+# Local cache of GCS output listings
+CACHE_DIR = CONFIG_DIR / "cache"
+OUTPUTS_CACHE_TTL = 300
+
+# Runs are capped at 24h, so a listing taken this long after a run started only
+# changes if the run is resumed; those listings are kept for a day instead
+RUN_SETTLED_AFTER = timedelta(hours=48)
+SETTLED_CACHE_TTL = 24 * 3600
+
+# Concurrent requests and retries when loading mock data into Spin
+INIT_MAX_WORKERS = 16
+INIT_RETRIES = 3
+
+# Digests of the mock data last loaded into Spin, so init only pushes changes
+INIT_STATE_PATH = "init/applied-state.json"
+INIT_STATE_VERSION = 2
+
+# Init state for a Spin stand-in on this machine (see deepfabric-job/local_spin.py),
+# which needs neither an identity token nor the bucket
+LOCAL_INIT_STATE_FILE = CACHE_DIR / "local-init-state.json"
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+# Index of runs and output files that each job appends to after uploading,
+# one .jsonl shard per month
+CATALOG_PREFIX = "catalog/"
+CATALOG_READ_ATTEMPTS = 3
+
+# Concurrent uploads and default job start rate when submitting several configs
+SUBMIT_MAX_WORKERS = 8
+SUBMIT_RATE_LIMIT = 5.0
+
+# Progress status objects written by running jobs, one per task
+PROGRESS_PREFIX = "progress"
+
+# status --watch polls this often while progress changes, backing off to the max when idle
+WATCH_MIN_INTERVAL = 2.0
+WATCH_MAX_INTERVAL = 30.0
+WATCH_BACKOFF = 1.5
+
+# Weight of the newest rate sample in the moving-average ETA
+WATCH_RATE_SMOOTHING = 0.3
+
+# Log entries per page in historical mode
+LOG_PAGE_SIZE = 1000
+
+# Past entries logs shows when neither --limit nor --since is given
+LOG_DEFAULT_LIMIT = 100
+
+# Seconds the tail API holds entries to deliver them in order
+LOG_TAIL_BUFFER_WINDOW = 2
+
+# Recent entry IDs remembered to skip duplicates when a tail session reopens
+LOG_TAIL_DEDUPE = 10000
+
+# Identity tokens reused across invocations until shortly before they expire
+TOKEN_CACHE_FILE = CACHE_DIR / "identity-tokens.json"
+TOKEN_EXPIRY_MARGIN = 60
+
+# Parsed config file, loaded once per process
+_config = None
+
+# Identity tokens obtained in this process, keyed by credentials and audience
+_identity_tokens = {}
+
 
 def load_config() -> dict:
-    """Load CLI configuration."""
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    """Load CLI configuration.
+
+    The file is parsed once per process; callers get their own copy.
+    """
+    global _config
+    if _config is None:
+        _config = {}
+        if CONFIG_FILE.exists():
+            with open(CONFIG_FILE) as f:
+                _config = yaml.safe_load(f) or {}
+    return dict(_config)
 
 
 def save_config(config: dict) -> None:
     """Save CLI configuration."""
+    global _config
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     with open(CONFIG_FILE, "w") as f:
         yaml.safe_dump(config, f)
+    _config = dict(config)
 
 
 def get_config_value(key: str, required: bool = True) -> str | None:
@@ -81,7 +199,7 @@ def config_set(key: str, value: str):
     cfg = load_config()
     cfg[key] = value
     save_config(cfg)
-    console.print(f"[green]Set {key}[/green]")
+    click.secho(f"Set {key}", fg="green")
 
 
 @config.command("get")
@@ -91,14 +209,16 @@ def config_get(key: str):
     cfg = load_config()
     value = cfg.get(key)
     if value:
-        console.print(value)
+        click.echo(value)
     else:
-        console.print(f"[yellow]{key} not set[/yellow]")
+        click.secho(f"{key} not set", fg="yellow")
 
 
 @config.command("list")
 def config_list():
     """List all configuration values."""
+    from rich.table import Table
+
     cfg = load_config()
     if not cfg:
         console.print("[yellow]No configuration set[/yellow]")
@@ -136,28 +256,157 @@ def config_init(project: str, region: str, bucket: str, progress_interval: int):
     cfg["job_name"] = "deepfabric-job"
     cfg["progress_interval"] = progress_interval
     save_config(cfg)
-    console.print("[green]Configuration saved![/green]")
-    console.print(f"Config file: {CONFIG_FILE}")
+    click.secho("Configuration saved!", fg="green")
+    click.echo(f"Config file: {CONFIG_FILE}")
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.next_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            wait_until = max(self.next_at, now)
+            self.next_at = wait_until + self.interval
+        time.sleep(max(wait_until - now, 0))
+
+
+def build_run_job_request(
+    job_path: str,
+    gcs_config_path: str,
+    run_name: str,
+    timestamp: str,
+    timeout: int,
+    topic_only: bool = False,
+    topics_load: str | None = None,
+    shards: int = 1,
+    resume: str | None = None,
+):
+    """Build the RunJobRequest for one DeepFabric run."""
+    from google.cloud import run_v2
+
+    # Build environment variables
+    env_vars = [
+        run_v2.EnvVar(name="CONFIG_PATH", value=gcs_config_path),
+        run_v2.EnvVar(name="JOB_NAME", value=run_name),
+    ]
+
+    # Add progress interval from dfcloud config
+    cfg = load_config()
+    progress_interval = cfg.get("progress_interval", 900)
+    env_vars.append(run_v2.EnvVar(name="PROGRESS_INTERVAL", value=str(progress_interval)))
+
+    if topic_only:
+        env_vars.append(run_v2.EnvVar(name="TOPIC_ONLY", value="true"))
+    elif topics_load:
+        env_vars.append(run_v2.EnvVar(name="TOPICS_LOAD", value=topics_load))
+
+    # Resumed runs and shards need a fixed output folder to write into
+    if resume:
+        env_vars.append(run_v2.EnvVar(name="RESUME_FROM", value=resume))
+    elif shards > 1:
+        env_vars.append(run_v2.EnvVar(name="RUN_TIMESTAMP", value=timestamp))
+
+    # Create execution with overrides
+    overrides = run_v2.RunJobRequest.Overrides(
+        container_overrides=[run_v2.RunJobRequest.Overrides.ContainerOverride(env=env_vars)],
+        task_count=shards,
+        timeout=f"{timeout}s",
+    )
+
+    return run_v2.RunJobRequest(name=job_path, overrides=overrides)
+
+
+def get_execution_id(operation) -> str | None:
+    """Get the execution ID from a run_job operation, if its metadata has it."""
+    try:
+        # The operation returns an Execution
+        if hasattr(operation, "metadata") and operation.metadata:
+            return operation.metadata.name.split("/")[-1]
+    except Exception:
+        pass
+    return None
+
+
+def load_submit_manifest(manifest_path: str) -> list[tuple[Path, str | None]]:
+    """Load a manifest of configs to submit as (config path, job name) pairs.
+
+    The manifest is a YAML list whose items are either a config path or a
+    mapping with `config` and an optional `name`. Relative paths are
+    resolved against the manifest's directory.
+    """
+    base_dir = Path(manifest_path).parent
+    with open(manifest_path) as f:
+        items = yaml.safe_load(f) or []
+
+    entries = []
+    for item in items:
+        if isinstance(item, str):
+            item = {"config": item}
+        config_path = base_dir / item["config"]
+        if not config_path.exists():
+            raise click.BadParameter(f"Config not found: {config_path}", param_hint="--manifest")
+        entries.append((config_path, item.get("name")))
+    return entries
 
 
 @cli.command()
-@click.argument("config_file", type=click.Path(exists=True))
+@click.argument("config_files", nargs=-1, type=click.Path(exists=True))
+@click.option(
+    "--manifest",
+    "-m",
+    type=click.Path(exists=True),
+    help="YAML list of configs to submit",
+)
 @click.option("--name", "-n", help="Job name (defaults to config filename)")
 @click.option("--wait/--no-wait", default=False, help="Wait for job completion")
 @click.option("--timeout", default=86400, help="Job timeout in seconds (default: 24h)")
 @click.option("--topic-only", is_flag=True, help="Only generate topic graph")
-@click.option("--topics-load", type=str, help="GCS path to existing topic graph")
+@click.option(
+    "--topics-load",
+    type=str,
+    help="GCS path to existing topic graph, or JOB[/TIMESTAMP] to use a run's graph",
+)
+@click.option(
+    "--shards",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Split the sample budget across N parallel Cloud Run tasks",
+)
+@click.option(
+    "--resume",
+    type=str,
+    help="Output path of an interrupted run to continue from its last checkpoint",
+)
+@click.option(
+    "--rate",
+    default=SUBMIT_RATE_LIMIT,
+    type=click.FloatRange(min=0, min_open=True),
+    show_default=True,
+    help="Maximum job starts per second when submitting several configs",
+)
 def submit(
-    config_file: str,
+    config_files: tuple[str, ...],
+    manifest: str | None,
     name: str | None,
     wait: bool,
     timeout: int,
     topic_only: bool,
     topics_load: str | None,
+    shards: int,
+    resume: str | None,
+    rate: float,
 ):
     """Submit a DeepFabric job.
 
-    CONFIG_FILE is the path to your deepfabric YAML configuration file.
+    CONFIG_FILES are paths to deepfabric YAML configuration files. Several
+    configs (or a --manifest) are uploaded in parallel and started as one
+    execution each.
 
     Examples:
 
@@ -169,14 +418,71 @@ def submit(
 
         # Generate dataset using existing topic graph
         dfcloud submit config.yaml --topics-load outputs/my-job/20240115-120000/topics.jsonl
+
+        # Use the topic graph from the latest successful run of a job
+        dfcloud submit config.yaml --topics-load my-topics-job
+
+        # Split 10k samples across 10 parallel tasks sharing one topic graph
+        dfcloud submit config.yaml --topics-load <GCS Path> --shards 10
+
+        # Continue a run that timed out, from its last checkpoint
+        dfcloud submit config.yaml --resume outputs/my-job/20240115-120000
+
+        # Launch a sweep, one execution per config
+        dfcloud submit configs/*.yaml --topics-load my-topics-job
+        dfcloud submit --manifest sweep.yaml
     """
+    from google.cloud import run_v2, storage
+
+    entries = [(Path(c), None) for c in config_files]
+    if manifest:
+        entries += load_submit_manifest(manifest)
+    if not entries:
+        console.print("[red]Error:[/red] Pass at least one config file or --manifest")
+        sys.exit(1)
+
+    if topic_only and shards > 1:
+        console.print("[red]Error:[/red] --shards cannot be used with --topic-only")
+        sys.exit(1)
+    if topic_only and resume:
+        console.print("[red]Error:[/red] --resume cannot be used with --topic-only")
+        sys.exit(1)
+
     project_id = get_config_value("project_id")
     region = get_config_value("region")
     bucket = get_config_value("bucket")
     job_name = get_config_value("job_name")
 
-    config_path = Path(config_file)
-    run_name = name or config_path.stem
+    if len(entries) > 1:
+        if name or resume or wait:
+            console.print(
+                "[red]Error:[/red] --name, --resume and --wait only work with a single config"
+            )
+            sys.exit(1)
+        submit_batch(
+            entries,
+            timeout=timeout,
+            topic_only=topic_only,
+            topics_load=topics_load,
+            shards=shards,
+            rate=rate,
+        )
+        return
+
+    config_path, name = entries[0][0], name or entries[0][1]
+
+    # Accept gs://bucket/outputs/... as well as outputs/...
+    if resume:
+        resume = resume.removeprefix(f"gs://{bucket}/").strip("/")
+        if not resume.startswith("outputs/") or len(resume.split("/")) != 3:
+            console.print(f"[red]Error:[/red] Expected outputs/<job>/<timestamp>, got: {resume}")
+            sys.exit(1)
+        # The resumed run writes into this folder, so its cached listing goes stale
+        cache = OutputsCache(bucket)
+        cache.drop("files", f"{resume}/")
+        cache.save()
+
+    run_name = name or (resume.split("/")[1] if resume else config_path.stem)
 
     # Generate unique config path in GCS
     timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
@@ -184,10 +490,15 @@ def submit(
 
     console.print(f"[bold]Submitting job:[/bold] {run_name}")
 
+    client = storage.Client(project=project_id)
+    bucket_obj = client.bucket(bucket)
+
+    # Accept a job name (latest run) or JOB/TIMESTAMP for --topics-load
+    if topics_load:
+        topics_load = resolve_topics_load(bucket_obj, topics_load)
+
     # Upload config to GCS
     with console.status("Uploading config to GCS..."):
-        client = storage.Client(project=project_id)
-        bucket_obj = client.bucket(bucket)
         blob = bucket_obj.blob(gcs_config_path)
         blob.upload_from_filename(str(config_path))
 
@@ -198,51 +509,35 @@ def submit(
     elif topics_load:
         console.print("  Mode: [cyan]Dataset generation[/cyan]")
         console.print(f"  Topics: gs://{bucket}/{topics_load}")
+    if resume:
+        console.print(f"  Resuming: gs://{bucket}/{resume}")
+    if shards > 1:
+        console.print(f"  Shards: [cyan]{shards}[/cyan]")
+        if not topics_load:
+            console.print("  [yellow]Note:[/yellow] each shard will generate its own topic graph")
 
     # Execute Cloud Run Job
     with console.status("Starting Cloud Run Job..."):
         jobs_client = run_v2.JobsClient()
         job_path = f"projects/{project_id}/locations/{region}/jobs/{job_name}"
-
-        # Build environment variables
-        env_vars = [
-            run_v2.EnvVar(name="CONFIG_PATH", value=gcs_config_path),
-            run_v2.EnvVar(name="JOB_NAME", value=run_name),
-        ]
-
-        # Add progress interval from dfcloud config
-        cfg = load_config()
-        progress_interval = cfg.get("progress_interval", 900)
-        env_vars.append(run_v2.EnvVar(name="PROGRESS_INTERVAL", value=str(progress_interval)))
-
-        if topic_only:
-            env_vars.append(run_v2.EnvVar(name="TOPIC_ONLY", value="true"))
-        elif topics_load:
-            env_vars.append(run_v2.EnvVar(name="TOPICS_LOAD", value=topics_load))
-
-        # Create execution with overrides
-        overrides = run_v2.RunJobRequest.Overrides(
-            container_overrides=[run_v2.RunJobRequest.Overrides.ContainerOverride(env=env_vars)],
-            timeout=f"{timeout}s",
+        request = build_run_job_request(
+            job_path,
+            gcs_config_path,
+            run_name,
+            timestamp,
+            timeout,
+            topic_only=topic_only,
+            topics_load=topics_load,
+            shards=shards,
+            resume=resume,
         )
-
-        request = run_v2.RunJobRequest(name=job_path, overrides=overrides)
-
         operation = jobs_client.run_job(request=request)
 
-    # Get execution name from operation metadata
-    execution_name = None
-    try:
-        # The operation returns an Execution
-        if hasattr(operation, "metadata") and operation.metadata:
-            execution_name = operation.metadata.name
-    except Exception:
-        pass
+    execution_id = get_execution_id(operation)
 
     console.print("  [green]Job submitted![/green]")
 
-    if execution_name:
-        execution_id = execution_name.split("/")[-1]
+    if execution_id:
         console.print(f"  Execution ID: {execution_id}")
         console.print(f"\nTo check status: dfcloud status {execution_id}")
         console.print(f"To view logs:    dfcloud logs {execution_id}")
@@ -263,6 +558,91 @@ def submit(
             sys.exit(1)
 
 
+def submit_batch(
+    entries: list[tuple[Path, str | None]],
+    timeout: int,
+    topic_only: bool,
+    topics_load: str | None,
+    shards: int,
+    rate: float,
+) -> None:
+    """Upload several configs in parallel and start one execution per config."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from google.cloud import run_v2, storage
+    from rich.markup import escape
+    from rich.table import Table
+
+    project_id = get_config_value("project_id")
+    region = get_config_value("region")
+    bucket = get_config_value("bucket")
+    job_name = get_config_value("job_name")
+
+    # Runs share one timestamp, so run names must be unique to keep config paths apart
+    runs = [(config_path, name or config_path.stem) for config_path, name in entries]
+    run_names = [run_name for _, run_name in runs]
+    duplicates = sorted({n for n in run_names if run_names.count(n) > 1})
+    if duplicates:
+        console.print(f"[red]Error:[/red] Duplicate job names: {', '.join(duplicates)}")
+        console.print("Give each config a unique filename or a name in the manifest")
+        sys.exit(1)
+
+    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    storage_client = storage.Client(project=project_id)
+    bucket_obj = storage_client.bucket(bucket)
+    jobs_client = run_v2.JobsClient()
+    job_path = f"projects/{project_id}/locations/{region}/jobs/{job_name}"
+    limiter = RateLimiter(rate)
+
+    if topics_load:
+        topics_load = resolve_topics_load(bucket_obj, topics_load)
+
+    def submit_one(config_path: Path, run_name: str) -> str:
+        gcs_config_path = f"configs/{run_name}/{timestamp}/config.yaml"
+        bucket_obj.blob(gcs_config_path).upload_from_filename(str(config_path))
+
+        request = build_run_job_request(
+            job_path,
+            gcs_config_path,
+            run_name,
+            timestamp,
+            timeout,
+            topic_only=topic_only,
+            topics_load=topics_load,
+            shards=shards,
+        )
+        limiter.wait()
+        operation = jobs_client.run_job(request=request)
+        return get_execution_id(operation) or "-"
+
+    console.print(f"[bold]Submitting {len(runs)} jobs[/bold] (up to {rate:g} starts/s)")
+
+    with console.status("Uploading configs and starting jobs..."):
+        with ThreadPoolExecutor(max_workers=SUBMIT_MAX_WORKERS) as pool:
+            futures = [pool.submit(submit_one, *run) for run in runs]
+
+    table = Table(title="Submitted Jobs")
+    table.add_column("Config", style="dim")
+    table.add_column("Job Name", style="cyan")
+    table.add_column("Execution ID")
+
+    failed = 0
+    for (config_path, run_name), future in zip(runs, futures):
+        try:
+            execution = future.result()
+        except Exception as e:
+            failed += 1
+            execution = f"[red]Failed: {escape(str(e))}[/red]"
+        table.add_row(str(config_path), run_name, execution)
+
+    console.print(table)
+
+    if failed:
+        console.print(f"\n[red]{failed} of {len(runs)} jobs failed to start[/red]")
+        sys.exit(1)
+    console.print("\nTo list executions: dfcloud list")
+
+
 @cli.command("import-tools")
 @click.option(
     "--mcp-command",
@@ -278,6 +658,8 @@ def import_tools(mcp_command: str, wait: bool):
 
     Run this once after deploying, or when the MCP server tools change.
     """
+    from google.cloud import run_v2
+
     project_id = get_config_value("project_id")
     region = get_config_value("region")
     job_name = get_config_value("job_name")
@@ -340,16 +722,97 @@ def import_tools(mcp_command: str, wait: bool):
             console.print(f"To view logs:    dfcloud logs {execution_id}")
 
 
+EXECUTION_STATES = ["succeeded", "failed", "cancelled", "running", "pending"]
+
+STATE_LABELS = {
+    "succeeded": "[green]Succeeded[/green]",
+    "failed": "[red]Failed[/red]",
+    "cancelled": "[dim]Cancelled[/dim]",
+    "running": "[yellow]Running[/yellow]",
+    "pending": "[blue]Pending[/blue]",
+}
+
+# Executions fetched per list request
+EXECUTIONS_PAGE_SIZE = 50
+
+
+def get_execution_state(execution) -> str:
+    """Get the state of an execution as one of EXECUTION_STATES.
+
+    A sharded execution has several tasks, so it only succeeded once every
+    task has, and it is running while any task is unfinished.
+    """
+    task_count = execution.task_count or 1
+    if execution.completion_time:
+        if execution.cancelled_count > 0:
+            return "cancelled"
+        if execution.failed_count == 0 and execution.succeeded_count >= task_count:
+            return "succeeded"
+        return "failed"
+    if execution.cancelled_count > 0:
+        return "cancelled"
+    finished = execution.succeeded_count + execution.failed_count
+    if execution.running_count > 0 or finished > 0:
+        return "running"
+    return "pending"
+
+
+def iter_executions(
+    executions_client,
+    parent: str,
+    limit: int | None = None,
+    state: str | None = None,
+    since: datetime | None = None,
+):
+    """Yield executions of a job newest first, stopping as early as possible.
+
+    The Cloud Run API has no filter parameter for executions, but lists
+    them newest first, so pages are fetched one at a time and listing stops
+    once `limit` matches are found or executions older than `since` appear.
+    """
+    from google.cloud import run_v2
+
+    since = since.replace(tzinfo=timezone.utc) if since else None
+    page_size = EXECUTIONS_PAGE_SIZE
+    if limit and not state:
+        page_size = min(limit, EXECUTIONS_PAGE_SIZE)
+
+    request = run_v2.ListExecutionsRequest(parent=parent, page_size=page_size)
+    found = 0
+    for page in executions_client.list_executions(request=request).pages:
+        for execution in sorted(page.executions, key=lambda x: x.create_time, reverse=True):
+            if since and execution.create_time < since:
+                return
+            if state and get_execution_state(execution) != state:
+                continue
+            yield execution
+            found += 1
+            if limit and found >= limit:
+                return
+
+
 @cli.command()
 @click.argument("execution_id", required=False)
-def status(execution_id: str | None):
+@click.option(
+    "--state",
+    type=click.Choice(EXECUTION_STATES),
+    help="Show the latest execution in this state",
+)
+@click.option("--since", help="Only consider executions newer than this, e.g. 2d or 2024-01-15")
+@click.option("--watch", "-w", is_flag=True, help="Show live progress until the execution ends")
+def status(execution_id: str | None, state: str | None, since: str | None, watch: bool):
     """Check job execution status.
 
     If EXECUTION_ID is not provided, shows status of the latest execution.
+    With --watch, shows a live view of samples, throughput and ETA that
+    refreshes until the execution finishes.
     """
+    from google.cloud import run_v2
+
     project_id = get_config_value("project_id")
     region = get_config_value("region")
     job_name = get_config_value("job_name")
+    since_time = parse_since(since) if since else None
 
     executions_client = run_v2.ExecutionsClient()
 
@@ -360,7 +823,10 @@ def status(execution_id: str | None):
         )
         try:
             execution = executions_client.get_execution(name=execution_path)
-            _print_execution_status(execution)
+            if watch:
+                watch_execution(executions_client, execution)
+                return
+            _print_execution_status(execution, get_execution_progress(execution))
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             sys.exit(1)
@@ -368,34 +834,275 @@ def status(execution_id: str | None):
         # Get latest execution
         parent = f"projects/{project_id}/locations/{region}/jobs/{job_name}"
         try:
-            executions = list(executions_client.list_executions(parent=parent))
+            executions = list(
+                iter_executions(executions_client, parent, limit=1, state=state, since=since_time)
+            )
             if not executions:
                 console.print("[yellow]No executions found[/yellow]")
                 return
 
-            # Sort by creation time, newest first
-            executions.sort(key=lambda x: x.create_time, reverse=True)
-            _print_execution_status(executions[0])
+            if watch:
+                watch_execution(executions_client, executions[0])
+                return
+            _print_execution_status(executions[0], get_execution_progress(executions[0]))
         except Exception as e:
             console.print(f"[red]Error:[/red] {e}")
             sys.exit(1)
 
 
-def _print_execution_status(execution):
-    """Print execution status details."""
-    execution_id = execution.name.split("/")[-1]
+def load_progress_statuses(bucket_obj, execution_id: str) -> list[dict]:
+    """Load the progress status objects of each task of an execution."""
+    statuses = []
+    for blob in bucket_obj.list_blobs(prefix=f"{PROGRESS_PREFIX}/{execution_id}/"):
+        try:
+            statuses.append(json.loads(blob.download_as_bytes()))
+        except ValueError:
+            continue
+    return statuses
 
-    # Determine status
-    if execution.succeeded_count > 0:
-        status = "[green]Succeeded[/green]"
-    elif execution.failed_count > 0:
-        status = "[red]Failed[/red]"
-    elif execution.cancelled_count > 0:
-        status = "[dim]Cancelled[/dim]"
-    elif execution.running_count > 0:
-        status = "[yellow]Running[/yellow]"
+
+def get_execution_progress(execution) -> dict | None:
+    """Get the combined progress an execution reported, or None if there is none."""
+    from google.cloud import storage
+
+    bucket = get_config_value("bucket", required=False)
+    if not bucket:
+        return None
+    try:
+        client = storage.Client(project=get_config_value("project_id"))
+        statuses = load_progress_statuses(client.bucket(bucket), execution.name.split("/")[-1])
+    except Exception:
+        return None
+    return summarize_progress(statuses)
+
+
+def summarize_progress(statuses: list[dict]) -> dict | None:
+    """Combine per-task progress statuses into totals for the execution."""
+    if not statuses:
+        return None
+
+    done = [s["samples"]["done"] for s in statuses if s["samples"]["done"] is not None]
+    totals = [s["samples"]["total"] for s in statuses if s["samples"]["total"] is not None]
+    # Finished tasks no longer add to throughput or the time left
+    running = [s for s in statuses if s["state"] == "running"]
+    rates = [s["rate_per_second"] for s in running if s["rate_per_second"]]
+    etas = [s["eta_seconds"] for s in running if s["eta_seconds"] is not None]
+    p95s = [s["tool_calls"]["p95_ms"] for s in statuses if s["tool_calls"]["p95_ms"] is not None]
+
+    cache = {"hits": 0, "misses": 0}
+    for s in statuses:
+        stats = (s.get("proxy") or {}).get("execute_cache") or {}
+        cache["hits"] += stats.get("hits", 0)
+        cache["misses"] += stats.get("misses", 0)
+
+    return {
+        "tasks": len(statuses),
+        "running": len(running),
+        "done": sum(done) if done else None,
+        "total": sum(totals) if len(totals) == len(statuses) else None,
+        "rate_per_second": sum(rates) if rates else None,
+        # Shards run in parallel, so the execution finishes with its slowest task
+        "eta_seconds": max(etas) if etas else None,
+        "errors": sum(s["errors"]["count"] for s in statuses),
+        "tool_calls": sum(s["tool_calls"]["count"] for s in statuses),
+        "tool_call_p95_ms": max(p95s) if p95s else None,
+        "cache_hits": cache["hits"],
+        "cache_lookups": cache["hits"] + cache["misses"],
+        "updated_at": max(s["updated_at"] for s in statuses),
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration such as an ETA compactly, e.g. 1h 05m or 4m 10s."""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def _print_progress(progress: dict) -> None:
+    """Print reported progress of an execution."""
+    if progress["done"] is not None:
+        samples = f"{progress['done']}"
+        if progress["total"]:
+            samples += f"/{progress['total']} ({progress['done'] / progress['total'] * 100:.1f}%)"
+        console.print(f"  Samples: {samples}")
+    if progress["rate_per_second"]:
+        console.print(f"  Rate: {progress['rate_per_second'] * 60:.1f} samples/min")
+    if progress["eta_seconds"] is not None and progress["running"]:
+        console.print(f"  ETA: {format_seconds(progress['eta_seconds'])}")
+    if progress["tool_calls"]:
+        line = f"  Tool calls: {progress['tool_calls']}"
+        if progress["tool_call_p95_ms"] is not None:
+            line += f" (p95 {progress['tool_call_p95_ms']:.0f} ms)"
+        console.print(line)
+    if progress["errors"]:
+        console.print(f"  Errors: [red]{progress['errors']}[/red] lines")
+    console.print(f"  [dim]Progress updated: {progress['updated_at']}[/dim]")
+
+
+class ProgressWatcher:
+    """Polls an execution's progress objects, downloading only those that changed.
+
+    Until every task has reported, each poll lists the objects' names and
+    generations in one request and fetches those with a new generation. Once
+    the task set is known, each object is fetched directly with
+    if_generation_not_match, which costs a single 304 while it is unchanged
+    and needs no listing.
+    """
+
+    def __init__(self, bucket_obj, execution_id: str, task_count: int = 1):
+        self.bucket_obj = bucket_obj
+        self.prefix = f"{PROGRESS_PREFIX}/{execution_id}/"
+        self.task_count = task_count
+        self.statuses = {}  # name -> (generation, status)
+
+    def poll(self) -> bool:
+        """Refresh statuses. Returns True if any progress object changed."""
+        if len(self.statuses) < self.task_count:
+            return self._poll_listing()
+
+        from google.api_core import exceptions
+
+        changed = False
+        for name, (generation, _) in list(self.statuses.items()):
+            blob = self.bucket_obj.blob(name)
+            try:
+                data = blob.download_as_bytes(if_generation_not_match=generation)
+                self.statuses[name] = (blob.generation, json.loads(data))
+                changed = True
+            except (exceptions.NotModified, exceptions.PreconditionFailed):
+                continue  # Unchanged since the last poll
+            except exceptions.NotFound:
+                del self.statuses[name]  # Relisted next poll
+            except ValueError:
+                continue  # Caught mid-write; picked up next poll
+        return changed
+
+    def _poll_listing(self) -> bool:
+        from google.api_core import exceptions
+
+        changed = False
+        blobs = self.bucket_obj.list_blobs(
+            prefix=self.prefix, fields="items(name,generation),nextPageToken"
+        )
+        for blob in blobs:
+            cached = self.statuses.get(blob.name)
+            if cached and cached[0] == blob.generation:
+                continue
+            try:
+                data = blob.download_as_bytes(if_generation_match=blob.generation)
+                self.statuses[blob.name] = (blob.generation, json.loads(data))
+                changed = True
+            except (exceptions.PreconditionFailed, exceptions.NotFound, ValueError):
+                continue  # Rewritten since listing; picked up next poll
+        return changed
+
+    def summary(self) -> dict | None:
+        return summarize_progress([status for _, status in self.statuses.values()])
+
+
+def render_watch_panel(execution, progress: dict | None, rate: float | None):
+    """Build the live status panel for status --watch."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    execution_id = execution.name.split("/")[-1]
+    table = Table.grid(padding=(0, 2))
+    table.add_column(style="bold")
+    table.add_column()
+    table.add_row("Status", STATE_LABELS[get_execution_state(execution)])
+    table.add_row("Created", str(execution.create_time))
+
+    if progress and progress["done"] is not None:
+        samples = str(progress["done"])
+        if progress["total"]:
+            samples += f" / {progress['total']} ({progress['done'] / progress['total'] * 100:.1f}%)"
+        table.add_row("Samples", samples)
+    if progress and progress["tasks"] > 1:
+        table.add_row("Tasks running", f"{progress['running']} / {progress['tasks']}")
+
+    rate = rate or (progress and progress["rate_per_second"])
+    if rate:
+        table.add_row("Rate", f"{rate * 60:.1f} samples/min")
+    running = get_execution_state(execution) == "running"
+    if running and progress and progress["running"] and rate and progress["total"]:
+        eta = (progress["total"] - progress["done"]) / rate
+        table.add_row("ETA", format_seconds(max(eta, 0)))
+
+    if progress and progress["cache_lookups"]:
+        hit_rate = progress["cache_hits"] / progress["cache_lookups"] * 100
+        table.add_row("Proxy cache", f"{hit_rate:.1f}% hits of {progress['cache_lookups']}")
+    if progress and progress["tool_calls"]:
+        latency = f"{progress['tool_calls']}"
+        if progress["tool_call_p95_ms"] is not None:
+            latency += f" (p95 {progress['tool_call_p95_ms']:.0f} ms)"
+        table.add_row("Tool calls", latency)
+    if progress and progress["errors"]:
+        table.add_row("Errors", f"[red]{progress['errors']}[/red] lines")
+    if progress:
+        table.add_row("Updated", f"[dim]{progress['updated_at']}[/dim]")
     else:
-        status = "[blue]Pending[/blue]"
+        table.add_row("Progress", "[dim]waiting for the job to report[/dim]")
+
+    return Panel(table, title=f"Execution {execution_id}", expand=False)
+
+
+def watch_execution(executions_client, execution) -> None:
+    """Show live progress of an execution until it finishes or Ctrl+C."""
+    from google.cloud import storage
+    from rich.live import Live
+
+    bucket = get_config_value("bucket")
+    client = storage.Client(project=get_config_value("project_id"))
+    watcher = ProgressWatcher(
+        client.bucket(bucket), execution.name.split("/")[-1], execution.task_count or 1
+    )
+
+    interval = WATCH_MIN_INTERVAL
+    rate = None  # Moving average of samples/second between polls
+    last_sample = None  # (time, samples done)
+
+    try:
+        with Live(render_watch_panel(execution, None, None), console=get_console()) as live:
+            while True:
+                changed = watcher.poll()
+                progress = watcher.summary()
+
+                if changed and progress and progress["done"] is not None:
+                    # Time samples by when the job reported them, not when they were polled
+                    now = datetime.fromisoformat(progress["updated_at"].rstrip("Z")).timestamp()
+                    if last_sample and progress["done"] > last_sample[1] and now > last_sample[0]:
+                        sample_rate = (progress["done"] - last_sample[1]) / (now - last_sample[0])
+                        rate = (
+                            sample_rate
+                            if rate is None
+                            else WATCH_RATE_SMOOTHING * sample_rate
+                            + (1 - WATCH_RATE_SMOOTHING) * rate
+                        )
+                    last_sample = (now, progress["done"])
+
+                live.update(render_watch_panel(execution, progress, rate))
+                if get_execution_state(execution) not in ("running", "pending"):
+                    break
+
+                # Poll quickly while progress moves, back off while it doesn't
+                if changed:
+                    interval = WATCH_MIN_INTERVAL
+                else:
+                    interval = min(interval * WATCH_BACKOFF, WATCH_MAX_INTERVAL)
+                time.sleep(interval)
+                execution = executions_client.get_execution(name=execution.name)
+    except KeyboardInterrupt:
+        pass
+
+
+def _print_execution_status(execution, progress: dict | None = None):
+    """Print execution status details."""
+    execution_id = execution.name.split("/")[-1]
+    status = STATE_LABELS[get_execution_state(execution)]
 
     console.print(f"\n[bold]Execution:[/bold] {execution_id}")
     console.print(f"  Status: {status}")
@@ -406,83 +1113,218 @@ def _print_execution_status(execution):
         console.print(f"  Completed: {execution.completion_time}")
         console.print(f"  Duration: {duration}")
 
+    if progress:
+        _print_progress(progress)
+
+
+def build_log_filter(job_name: str, execution_id: str | None, since: datetime | None) -> str:
+    """Build a Cloud Logging filter for a job's logs."""
+    filter_str = f'resource.type="cloud_run_job" resource.labels.job_name="{job_name}"'
+    if execution_id:
+        filter_str += f' labels."run.googleapis.com/execution_name"="{execution_id}"'
+    if since:
+        # Naive datetimes are UTC, as parse_since returns them
+        if since.tzinfo is not None:
+            since = since.astimezone(timezone.utc)
+        filter_str += f' timestamp>="{since.strftime("%Y-%m-%dT%H:%M:%S.%fZ")}"'
+    return filter_str
+
+
+def format_log_entry(entry) -> str | None:
+    """Get the printable text of a log entry, or None if it has none."""
+    if entry.text_payload:
+        return entry.text_payload.rstrip("\n")
+    if "json_payload" in entry:
+        payload = dict(entry.json_payload)
+        return str(payload.get("message") or json.dumps(payload, default=str))
+    return None
+
+
+def write_log_entries(entries, grep: str | None) -> None:
+    """Write a batch of log entries to stdout in one write.
+
+    Writing synchronously before fetching more lets a slow terminal or pipe
+    hold back the stream instead of buffering entries in memory.
+    """
+    lines = []
+    for entry in entries:
+        text = format_log_entry(entry)
+        if text is None or (grep and grep not in text):
+            continue
+        lines.append(text)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def print_log_history(
+    logging_client, project_id: str, log_filter: str, limit: int, newest: bool, grep: str | None
+) -> None:
+    """Print historical log entries page by page.
+
+    With `newest`, fetches the latest `limit` entries and prints them oldest
+    first; otherwise streams entries oldest first as pages arrive.
+    """
+    from google.cloud.logging_v2.types import ListLogEntriesRequest
+
+    request = ListLogEntriesRequest(
+        resource_names=[f"projects/{project_id}"],
+        filter=log_filter,
+        order_by="timestamp desc" if newest else "timestamp asc",
+        page_size=min(limit, LOG_PAGE_SIZE) if limit else LOG_PAGE_SIZE,
+    )
+
+    newest_entries = []
+    count = 0
+    for page in logging_client.list_log_entries(request=request).pages:
+        entries = list(page.entries)
+        if limit:
+            entries = entries[: limit - count]
+        count += len(entries)
+        if newest:
+            newest_entries.extend(entries)
+        else:
+            write_log_entries(entries, grep)
+        if limit and count >= limit:
+            break
+
+    if newest:
+        write_log_entries(reversed(newest_entries), grep)
+
+
+def follow_log_entries(logging_client, project_id: str, log_filter: str, grep: str | None) -> None:
+    """Stream new log entries with the Logging tail API until interrupted.
+
+    Tail sessions are reopened when the server ends them, resuming from the
+    last entry seen and skipping entries that were already printed.
+    """
+    from google.api_core import exceptions
+    from google.cloud.logging_v2.types import TailLogEntriesRequest
+
+    seen_ids = set()
+    seen_order = deque()
+    last_timestamp = None
+
+    def requests_iter(request, session_done: threading.Event):
+        yield request
+        # Keep the request stream open; closing it ends the tail session
+        session_done.wait()
+
+    while True:
+        session_filter = log_filter
+        if last_timestamp:
+            session_filter += f' timestamp>="{last_timestamp.isoformat()}"'
+        request = TailLogEntriesRequest(
+            resource_names=[f"projects/{project_id}"],
+            filter=session_filter,
+            buffer_window={"seconds": LOG_TAIL_BUFFER_WINDOW},
+        )
+        session_done = threading.Event()
+        try:
+            stream = logging_client.tail_log_entries(requests=requests_iter(request, session_done))
+            for response in stream:
+                for info in response.suppression_info:
+                    err_console.print(
+                        f"[yellow]{info.suppressed_count} entries skipped by the "
+                        f"logging API ({info.reason.name})[/yellow]"
+                    )
+                entries = [e for e in response.entries if e.insert_id not in seen_ids]
+                for entry in entries:
+                    seen_ids.add(entry.insert_id)
+                    seen_order.append(entry.insert_id)
+                    if len(seen_order) > LOG_TAIL_DEDUPE:
+                        seen_ids.discard(seen_order.popleft())
+                    last_timestamp = entry.timestamp
+                write_log_entries(entries, grep)
+        except (exceptions.DeadlineExceeded, exceptions.ServiceUnavailable):
+            pass
+        finally:
+            session_done.set()
+        time.sleep(1)
+
 
 @cli.command()
 @click.argument("execution_id", required=False)
 @click.option("--follow", "-f", is_flag=True, help="Follow logs in real-time")
-def logs(execution_id: str | None, follow: bool):
+@click.option(
+    "--limit",
+    "-n",
+    type=int,
+    help=(
+        f"Number of past entries to show, 0 for all "
+        f"[default: {LOG_DEFAULT_LIMIT}, or all with --since]"
+    ),
+)
+@click.option("--since", help="Show entries newer than this, e.g. 2h or 2024-01-15")
+@click.option("--grep", help="Only show lines containing this text")
+def logs(
+    execution_id: str | None, follow: bool, limit: int | None, since: str | None, grep: str | None
+):
     """View job logs.
 
-    If EXECUTION_ID is not provided, shows logs for the latest execution.
+    If EXECUTION_ID is not provided, shows logs for all executions of the job.
+    Shows the last --limit entries, or with --since every entry from then on
+    in order (the first --limit of them if given). With --follow, keeps
+    streaming new entries until interrupted.
     """
+    from google.cloud.logging_v2.services.logging_service_v2 import LoggingServiceV2Client
+
     project_id = get_config_value("project_id")
-    region = get_config_value("region")
     job_name = get_config_value("job_name")
+    since_time = parse_since(since) if since else None
+    if limit is None:
+        limit = 0 if since_time else LOG_DEFAULT_LIMIT
 
-    # Build log query
-    if execution_id:
-        filter_str = (
-            f'resource.type="cloud_run_job" '
-            f'resource.labels.job_name="{job_name}" '
-            f'labels."run.googleapis.com/execution_name"="{execution_id}"'
-        )
-    else:
-        filter_str = f'resource.type="cloud_run_job" resource.labels.job_name="{job_name}"'
-
-    # Use gcloud for log viewing (simpler than the logging API)
-    import subprocess
-
-    cmd = [
-        "gcloud",
-        "logging",
-        "read",
-        filter_str,
-        f"--project={project_id}",
-        "--limit=100",
-        "--format=value(textPayload)",
-    ]
-
-    if follow:
-        console.print("[yellow]Following logs (Ctrl+C to stop)...[/yellow]\n")
-        # For follow mode, we need to use a different approach
-        cmd = [
-            "gcloud",
-            "beta",
-            "run",
-            "jobs",
-            "logs",
-            "read",
-            job_name,
-            f"--project={project_id}",
-            f"--region={region}",
-            "--tail=100",
-        ]
+    log_filter = build_log_filter(job_name, execution_id, since_time)
+    logging_client = LoggingServiceV2Client()
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.stdout:
-            console.print(result.stdout)
-        if result.stderr and "ERROR" in result.stderr:
-            console.print(f"[red]{result.stderr}[/red]")
-    except FileNotFoundError:
-        console.print("[red]Error:[/red] gcloud CLI not found.")
-        console.print("Please install the Google Cloud SDK.")
+        print_log_history(
+            logging_client,
+            project_id,
+            log_filter,
+            limit,
+            newest=since_time is None,
+            grep=grep,
+        )
+        if follow:
+            err_console.print("[yellow]Following logs (Ctrl+C to stop)...[/yellow]\n")
+            follow_log_entries(logging_client, project_id, log_filter, grep)
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # Output was piped into something like head that stopped reading
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
 @cli.command("list")
 @click.option("--limit", "-l", default=10, help="Number of executions to show")
-def list_executions(limit: int):
+@click.option(
+    "--state",
+    type=click.Choice(EXECUTION_STATES),
+    help="Only show executions in this state",
+)
+@click.option("--since", help="Only show executions newer than this, e.g. 2d or 2024-01-15")
+def list_executions(limit: int, state: str | None, since: str | None):
     """List recent job executions."""
+    from google.cloud import run_v2
+    from rich.table import Table
+
     project_id = get_config_value("project_id")
     region = get_config_value("region")
     job_name = get_config_value("job_name")
+    since_time = parse_since(since) if since else None
 
     executions_client = run_v2.ExecutionsClient()
     parent = f"projects/{project_id}/locations/{region}/jobs/{job_name}"
 
     try:
-        executions = list(executions_client.list_executions(parent=parent))
+        executions = list(
+            iter_executions(executions_client, parent, limit=limit, state=state, since=since_time)
+        )
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
@@ -491,10 +1333,6 @@ def list_executions(limit: int):
         console.print("[yellow]No executions found[/yellow]")
         return
 
-    # Sort by creation time, newest first
-    executions.sort(key=lambda x: x.create_time, reverse=True)
-    executions = executions[:limit]
-
     table = Table(title=f"Recent Executions ({job_name})")
     table.add_column("Execution ID", style="cyan")
     table.add_column("Status", style="bold")
@@ -503,17 +1341,7 @@ def list_executions(limit: int):
 
     for execution in executions:
         execution_id = execution.name.split("/")[-1]
-
-        if execution.succeeded_count > 0:
-            status = "[green]Succeeded[/green]"
-        elif execution.failed_count > 0:
-            status = "[red]Failed[/red]"
-        elif execution.cancelled_count > 0:
-            status = "[dim]Cancelled[/dim]"
-        elif execution.running_count > 0:
-            status = "[yellow]Running[/yellow]"
-        else:
-            status = "[blue]Pending[/blue]"
+        status = STATE_LABELS[get_execution_state(execution)]
 
         created = execution.create_time.strftime("%Y-%m-%d %H:%M") if execution.create_time else "-"
 
@@ -528,14 +1356,81 @@ def list_executions(limit: int):
     console.print(table)
 
 
+def load_download_manifest(output_dir: Path) -> dict:
+    """Load the download manifest for an output directory."""
+    manifest_path = output_dir / DOWNLOAD_MANIFEST
+    if manifest_path.exists():
+        with open(manifest_path) as f:
+            return json.load(f)
+    return {}
+
+
+def save_download_manifest(output_dir: Path, manifest: dict) -> None:
+    """Save the download manifest for an output directory."""
+    manifest_path = output_dir / DOWNLOAD_MANIFEST
+    tmp_path = manifest_path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp_path.replace(manifest_path)
+
+
+def is_blob_unchanged(blob, local_path: Path, entry: dict | None) -> bool:
+    """Check whether a local file already matches the blob recorded in the manifest."""
+    if not entry or not local_path.exists():
+        return False
+    return (
+        entry.get("generation") == blob.generation
+        and entry.get("md5") == blob.md5_hash
+        and local_path.stat().st_size == blob.size
+    )
+
+
+def is_run_part(relative_path: str) -> bool:
+    """Check whether a path relative to outputs/{job}/ is inside a run's working folders."""
+    parts = relative_path.split("/")
+    return len(parts) > 2 and parts[1] in RUN_PARTS_FOLDERS
+
+
+def download_blob(blob, local_path: Path, workers: int) -> None:
+    """Download a blob, splitting large files into concurrent range requests."""
+    from google.cloud.storage import transfer_manager
+
+    if blob.size and blob.size > SLICED_DOWNLOAD_THRESHOLD:
+        transfer_manager.download_chunks_concurrently(
+            blob,
+            str(local_path),
+            chunk_size=SLICED_DOWNLOAD_CHUNK_SIZE,
+            max_workers=workers,
+            worker_type=transfer_manager.THREAD,
+        )
+    else:
+        blob.download_to_filename(str(local_path))
+
+
 @cli.command()
 @click.argument("job_run_name")
 @click.option("--output", "-o", type=click.Path(), help="Output directory")
-def download(job_run_name: str, output: str | None):
+@click.option("--workers", "-w", default=8, type=click.IntRange(min=1), help="Parallel downloads")
+@click.option("--force", is_flag=True, help="Re-download files even if unchanged")
+@click.option(
+    "--parts",
+    is_flag=True,
+    help="Also download checkpoint chunks and per-shard outputs",
+)
+def download(job_run_name: str, output: str | None, workers: int, force: bool, parts: bool):
     """Download job outputs.
 
     JOB_RUN_NAME is the name you used when submitting the job.
+
+    Files already downloaded to the output directory are skipped unless they
+    changed in GCS since the last download. The checkpoint/ and shards/
+    folders inside each run hold the same data as its final files and are
+    skipped unless --parts is given, e.g. for a run that never finished.
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from google.cloud import storage
+
     project_id = get_config_value("project_id")
     bucket = get_config_value("bucket")
 
@@ -547,42 +1442,460 @@ def download(job_run_name: str, output: str | None):
 
     # List outputs for this job
     prefix = f"outputs/{job_run_name}/"
-    blobs = list(bucket_obj.list_blobs(prefix=prefix))
+    blobs = []
+    part_files = 0
+    for blob in bucket_obj.list_blobs(prefix=prefix):
+        if blob.name.endswith("/"):
+            continue
+        if not parts and is_run_part(blob.name[len(prefix) :]):
+            part_files += 1
+            continue
+        blobs.append(blob)
 
     if not blobs:
         console.print(f"[yellow]No outputs found for job: {job_run_name}[/yellow]")
         console.print(f"Looked in: gs://{bucket}/{prefix}")
+        if part_files:
+            console.print(
+                f"{part_files} checkpoint/shard files exist; use --parts to download them"
+            )
         return
 
-    console.print(f"[bold]Found {len(blobs)} files[/bold]\n")
-
+    manifest = {} if force else load_download_manifest(output_dir)
+    pending = []
+    skipped = 0
     for blob in blobs:
-        if blob.name.endswith("/"):
-            continue  # Skip folders
-
         # Create local path preserving structure
         relative_path = blob.name.replace(prefix, "")
         local_path = output_dir / relative_path
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+        if is_blob_unchanged(blob, local_path, manifest.get(blob.name)):
+            skipped += 1
+        else:
+            pending.append((blob, relative_path, local_path))
 
-        with console.status(f"Downloading {relative_path}..."):
-            blob.download_to_filename(str(local_path))
+    console.print(f"[bold]Found {len(blobs)} files[/bold] ({skipped} unchanged)")
+    if part_files:
+        console.print(f"Skipping {part_files} checkpoint/shard files (use --parts to include them)")
+    console.print()
 
-        size_mb = blob.size / (1024 * 1024)
-        console.print(f"  [green]✓[/green] {relative_path} ({size_mb:.1f} MB)")
+    manifest_lock = threading.Lock()
+    failed = 0
+
+    def fetch(blob, local_path: Path) -> None:
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        download_blob(blob, local_path, workers)
+        with manifest_lock:
+            manifest[blob.name] = {
+                "generation": blob.generation,
+                "md5": blob.md5_hash,
+                "size": blob.size,
+            }
+            save_download_manifest(output_dir, manifest)
+
+    with console.status(f"Downloading {len(pending)} files..."):
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(fetch, blob, local_path): (blob, relative_path)
+                for blob, relative_path, local_path in pending
+            }
+            for future in as_completed(futures):
+                blob, relative_path = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed += 1
+                    console.print(f"  [red]✗[/red] {relative_path}: {e}")
+                    continue
+                size_mb = blob.size / (1024 * 1024)
+                console.print(f"  [green]✓[/green] {relative_path} ({size_mb:.1f} MB)")
 
     console.print(f"\n[green]Downloaded to: {output_dir}[/green]")
+    if failed:
+        console.print(f"[red]{failed} files failed to download[/red]")
+        sys.exit(1)
+
+
+def parse_since(value: str) -> datetime:
+    """Parse a --since value into a UTC datetime.
+
+    Accepts a relative age such as 30m, 12h, 2d or 1w, or a date such as
+    2024-01-15 or 2024-01-15T12:00.
+    """
+    match = re.fullmatch(r"(\d+)([mhdw])", value.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        units = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+        return datetime.utcnow() - timedelta(**{units[unit]: amount})
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise click.BadParameter(f"Expected an age like 2d or a date like 2024-01-15, got: {value}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_run_timestamp(timestamp: str) -> datetime | None:
+    """Parse an outputs/<job>/<timestamp> folder name, if it is a timestamp."""
+    try:
+        return datetime.strptime(timestamp, "%Y%m%d-%H%M%S")
+    except ValueError:
+        return None
+
+
+class OutputsCache:
+    """On-disk cache of GCS output listings for one bucket.
+
+    Folder listings expire after OUTPUTS_CACHE_TTL seconds. File listings of
+    runs that had settled when they were fetched expire after
+    SETTLED_CACHE_TTL, since a resumed run can still write to its folder.
+    """
+
+    def __init__(self, bucket: str, refresh: bool = False):
+        self.path = CACHE_DIR / f"outputs-{bucket}.json"
+        self.refresh = refresh
+        self.data = {"prefixes": {}, "files": {}}
+        self.dirty = False
+        if self.path.exists() and not refresh:
+            try:
+                with open(self.path) as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    def get(self, kind: str, key: str, settled_at: float | None = None):
+        """Get cached items, or None. settled_at is in epoch seconds, like fetched_at."""
+        entry = self.data[kind].get(key)
+        if entry is None or self.refresh:
+            return None
+        settled = settled_at is not None and entry["fetched_at"] > settled_at
+        ttl = SETTLED_CACHE_TTL if settled else OUTPUTS_CACHE_TTL
+        if time.time() - entry["fetched_at"] < ttl:
+            return entry["items"]
+        return None
+
+    def put(self, kind: str, key: str, items: list) -> None:
+        self.data[kind][key] = {"fetched_at": time.time(), "items": items}
+        self.dirty = True
+
+    def drop(self, kind: str, key: str) -> None:
+        if self.data[kind].pop(key, None) is not None:
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.data, f)
+        tmp_path.replace(self.path)
+
+
+def list_child_prefixes(bucket_obj, prefix: str, cache: OutputsCache) -> list[str]:
+    """List the folder names directly under prefix, one page at a time."""
+    names = cache.get("prefixes", prefix)
+    if names is None:
+        iterator = bucket_obj.list_blobs(
+            prefix=prefix, delimiter="/", fields="prefixes,nextPageToken"
+        )
+        names = set()
+        for page in iterator.pages:
+            for child in page.prefixes:
+                name = child[len(prefix) :].rstrip("/")
+                if name:
+                    names.add(name)
+        names = sorted(names)
+        cache.put("prefixes", prefix, names)
+    return names
+
+
+def get_cached_run_files(run_prefix: str, cache: OutputsCache) -> list[dict] | None:
+    """Get a run folder's cached file listing, or None if it isn't cached or expired."""
+    run_time = parse_run_timestamp(run_prefix.rstrip("/").split("/")[-1])
+    settled_at = None
+    if run_time:
+        # Run timestamps are UTC; a naive timestamp() would read them as local time
+        settled_at = (run_time.replace(tzinfo=timezone.utc) + RUN_SETTLED_AFTER).timestamp()
+    return cache.get("files", run_prefix, settled_at=settled_at)
+
+
+def list_files_by_run(bucket_obj, prefix: str) -> dict[str, list[dict]]:
+    """List every file under prefix in pages, grouped by outputs/{job}/{timestamp}/ folder."""
+    runs = {}
+    iterator = bucket_obj.list_blobs(
+        prefix=prefix, fields="items(name,size,timeCreated),nextPageToken"
+    )
+    for page in iterator.pages:
+        for blob in page:
+            parts = blob.name.split("/")
+            if blob.name.endswith("/") or len(parts) < 4:
+                continue
+            runs.setdefault("/".join(parts[:3]) + "/", []).append(
+                {
+                    "name": blob.name,
+                    "size": blob.size or 0,
+                    "created": blob.time_created.isoformat() if blob.time_created else None,
+                }
+            )
+    for files in runs.values():
+        files.sort(key=lambda f: f["name"])
+    return runs
+
+
+def list_run_files(bucket_obj, run_prefix: str, cache: OutputsCache) -> list[dict]:
+    """List files under one run folder as dicts with name, size and created."""
+    files = get_cached_run_files(run_prefix, cache)
+    if files is None:
+        files = list_files_by_run(bucket_obj, run_prefix).get(run_prefix, [])
+        cache.put("files", run_prefix, files)
+    return files
+
+
+class ListingSource:
+    """Output runs discovered by listing folders in the bucket."""
+
+    def __init__(self, bucket_obj, cache: OutputsCache):
+        self.bucket_obj = bucket_obj
+        self.cache = cache
+
+    def jobs(self) -> list[str]:
+        return list_child_prefixes(self.bucket_obj, "outputs/", self.cache)
+
+    def runs(self, job_names: list[str], since: datetime | None):
+        """Yield (job, timestamp) for runs of the given jobs, newest first."""
+        runs = []
+        for job in job_names:
+            for timestamp in list_child_prefixes(self.bucket_obj, f"outputs/{job}/", self.cache):
+                run_time = parse_run_timestamp(timestamp)
+                if since and run_time and run_time < since:
+                    continue
+                runs.append((run_time or datetime.min, job, timestamp))
+        runs.sort(reverse=True)
+        for _, job, timestamp in runs:
+            yield job, timestamp
+
+    def files(self, job: str, timestamp: str) -> list[dict]:
+        return list_run_files(self.bucket_obj, f"outputs/{job}/{timestamp}/", self.cache)
+
+    def prefetch(self, runs: list[tuple[str, str]]) -> None:
+        """Fetch the files of every given run whose listing isn't cached.
+
+        Listing each run folder costs a request even when it holds a few
+        files, so when several runs are needed their job folders (or the whole
+        outputs/ folder) are listed once in 1000-object pages instead.
+        """
+        missing = [
+            (job, timestamp)
+            for job, timestamp in runs
+            if get_cached_run_files(f"outputs/{job}/{timestamp}/", self.cache) is None
+        ]
+        if len(missing) < 2:
+            return
+        jobs = {job for job, _ in missing}
+        prefix = f"outputs/{jobs.pop()}/" if len(jobs) == 1 else "outputs/"
+        listed = list_files_by_run(self.bucket_obj, prefix)
+        for job, timestamp in missing:
+            run_prefix = f"outputs/{job}/{timestamp}/"
+            self.cache.put("files", run_prefix, listed.get(run_prefix, []))
+
+
+class CatalogSource:
+    """Output runs read from the catalog index written by the job.
+
+    Run folders the catalog doesn't know about, such as runs from before it
+    existed or runs that crashed before recording themselves, are taken from
+    the listing instead, so they still show up. Only their folder names are
+    listed; cataloged runs never have their files listed.
+    """
+
+    def __init__(self, records: list[dict], listing: ListingSource):
+        # A resumed run appends a newer record for the same prefix
+        self.records = {}
+        for record in records:
+            self.records[record["prefix"]] = record
+        self.listing = listing
+
+    def jobs(self) -> list[str]:
+        jobs = {record["run"] for record in self.records.values()}
+        return sorted(jobs.union(self.listing.jobs()))
+
+    def runs(self, job_names: list[str], since: datetime | None):
+        """Yield (job, timestamp) for runs of the given jobs, newest first."""
+        runs = []
+        for record in self.records.values():
+            if record["run"] not in job_names:
+                continue
+            run_time = parse_run_timestamp(record["timestamp"])
+            if since and run_time and run_time < since:
+                continue
+            runs.append((run_time or datetime.min, record["run"], record["timestamp"]))
+        for job, timestamp in self.listing.runs(job_names, since):
+            if f"outputs/{job}/{timestamp}" not in self.records:
+                runs.append((parse_run_timestamp(timestamp) or datetime.min, job, timestamp))
+        runs.sort(reverse=True)
+        for _, job, timestamp in runs:
+            yield job, timestamp
+
+    def prefetch(self, runs: list[tuple[str, str]]) -> None:
+        """Fetch the files of given runs that aren't in the catalog."""
+        self.listing.prefetch(
+            [(job, ts) for job, ts in runs if f"outputs/{job}/{ts}" not in self.records]
+        )
+
+    def files(self, job: str, timestamp: str) -> list[dict]:
+        record = self.records.get(f"outputs/{job}/{timestamp}")
+        if record is None:
+            return self.listing.files(job, timestamp)
+        created = record.get("created_at", "").rstrip("Z") or None
+        return [
+            {"name": f["path"], "size": f["size_bytes"], "created": created}
+            for f in record.get("files", [])
+        ]
+
+
+def download_catalog_shard(blob) -> tuple[int | None, list[dict]] | None:
+    """Download one catalog shard as (generation, records), or None if it was deleted.
+
+    The download is pinned to the listed generation so the cached copy
+    matches it. A job appending in between makes that fail; the shard is
+    then re-read. If it keeps changing, the latest content is returned with
+    no generation so it is fetched again next time.
+    """
+    from google.api_core import exceptions
+
+    content = None
+    generation = None
+    for _ in range(CATALOG_READ_ATTEMPTS):
+        try:
+            content = blob.download_as_bytes(if_generation_match=blob.generation)
+            generation = blob.generation
+            break
+        except exceptions.PreconditionFailed:
+            try:
+                blob.reload()
+            except exceptions.NotFound:
+                return None
+        except exceptions.NotFound:
+            return None
+    if content is None:
+        try:
+            content = blob.download_as_bytes()
+        except exceptions.NotFound:
+            return None
+
+    records = [json.loads(line) for line in content.splitlines() if line.strip()]
+    return generation, records
+
+
+def load_catalog(bucket_obj, refresh: bool = False) -> list[dict] | None:
+    """Load the bucket's run catalog, or None if the bucket has none yet.
+
+    A local copy of each shard is kept per bucket and only re-downloaded
+    when its generation changes, so an unchanged catalog costs one list
+    request.
+    """
+    blobs = [
+        blob
+        for blob in bucket_obj.list_blobs(
+            prefix=CATALOG_PREFIX, fields="items(name,generation),nextPageToken"
+        )
+        if blob.name.endswith(".jsonl")
+    ]
+    if not blobs:
+        return None
+
+    cache_path = CACHE_DIR / f"catalog-{bucket_obj.name}.json"
+    cached = {}
+    if cache_path.exists() and not refresh:
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f).get("shards", {})
+        except (OSError, ValueError):
+            pass
+
+    shards = {}
+    for blob in sorted(blobs, key=lambda b: b.name):
+        entry = cached.get(blob.name)
+        if entry and entry["generation"] == blob.generation:
+            shards[blob.name] = entry
+            continue
+        shard = download_catalog_shard(blob)
+        if shard is not None:
+            generation, records = shard
+            shards[blob.name] = {"generation": generation, "records": records}
+
+    if shards != cached:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"shards": shards}, f)
+        tmp_path.replace(cache_path)
+
+    # Shards are monthly, so name order is chronological
+    return [record for name in sorted(shards) for record in shards[name]["records"]]
+
+
+def resolve_topics_load(bucket_obj, value: str) -> str:
+    """Resolve --topics-load given as JOB or JOB/TIMESTAMP to a topic graph path via the catalog.
+
+    Any other value is an object path and is returned unchanged.
+    """
+    match = re.fullmatch(r"([\w-]+)(?:/(\d{8}-\d{6}))?", value)
+    if not match:
+        return value
+
+    job, timestamp = match.groups()
+    records = load_catalog(bucket_obj) or []
+    for record in reversed(records):
+        if record["run"] != job or record.get("status") != "success":
+            continue
+        if timestamp and record["timestamp"] != timestamp:
+            continue
+        for f in record["files"]:
+            if f.get("kind") == "topics":
+                return f["path"]
+
+    # A bare object name that happens to look like a job name
+    if bucket_obj.blob(value).exists():
+        return value
+
+    console.print(f"[red]Error:[/red] No topic graph found in the catalog for: {value}")
+    console.print("Pass the GCS path instead (see: dfcloud outputs <job-name>)")
+    sys.exit(1)
+
+
+def format_size(size_bytes: int) -> str:
+    size_kb = size_bytes / 1024
+    return f"{size_kb:.1f} KB" if size_kb < 1024 else f"{size_kb / 1024:.1f} MB"
 
 
 @cli.command()
 @click.argument("job_name", required=False)
 @click.option("--files", "-f", is_flag=True, help="Show all files with sizes and timestamps")
-def outputs(job_name: str | None, files: bool):
+@click.option("--since", help="Only show runs newer than an age (2d, 12h) or date (2024-01-15)")
+@click.option("--limit", "-l", type=click.IntRange(min=1), help="Maximum number of files to show")
+@click.option("--refresh", is_flag=True, help="Ignore the local listing cache")
+@click.option("--scan", is_flag=True, help="List bucket folders instead of reading the catalog")
+def outputs(
+    job_name: str | None,
+    files: bool,
+    since: str | None,
+    limit: int | None,
+    refresh: bool,
+    scan: bool,
+):
     """List available outputs in GCS.
 
     If JOB_NAME is provided, lists files for that job.
     Use --files to show detailed file listing.
 
+    Runs are read from the catalog index that jobs write after uploading.
+    Run folders missing from it, e.g. from before the catalog existed, are
+    listed from the bucket. Use --scan to list every run from the bucket
+    instead. Listings are cached locally for a few minutes; use --refresh to
+    bypass the cache.
+
     Examples:
 
         # List all jobs with outputs
@@ -591,58 +1904,84 @@ def outputs(job_name: str | None, files: bool):
         # List files for a specific job
         dfcloud outputs my-job
 
-        # Show all files across all jobs
-        dfcloud outputs --files
+        # Show the 20 newest files across all jobs from the last 2 days
+        dfcloud outputs --files --since 2d --limit 20
     """
+    from google.cloud import storage
+
     project_id = get_config_value("project_id")
     bucket = get_config_value("bucket")
+    since_time = parse_since(since) if since else None
 
     client = storage.Client(project=project_id)
     bucket_obj = client.bucket(bucket)
+    cache = OutputsCache(bucket, refresh=refresh)
 
-    # If job_name provided, list files for that job
-    if job_name:
-        prefix = f"outputs/{job_name}/"
-        blobs = list(bucket_obj.list_blobs(prefix=prefix))
+    records = None if scan else load_catalog(bucket_obj, refresh=refresh)
+    source = ListingSource(bucket_obj, cache)
+    if records is not None:
+        source = CatalogSource(records, source)
+
+    try:
+        _print_outputs(source, job_name, files, since_time, limit)
+    finally:
+        cache.save()
 
-        if not blobs:
-            console.print(f"[yellow]No outputs found for job: {job_name}[/yellow]")
-            return
 
+def _print_outputs(
+    source: ListingSource | CatalogSource,
+    job_name: str | None,
+    files: bool,
+    since: datetime | None,
+    limit: int | None,
+):
+    """Render the outputs listing for the outputs command."""
+    from rich.table import Table
+
+    # If job_name provided, list files for that job
+    if job_name:
         table = Table(title=f"Outputs for {job_name}")
         table.add_column("File", style="cyan")
         table.add_column("Size", style="green", justify="right")
         table.add_column("Created", style="dim")
         table.add_column("GCS Path", style="dim")
 
-        for blob in sorted(blobs, key=lambda b: b.name):
-            if blob.name.endswith("/"):
-                continue
-
-            relative_path = blob.name.replace(f"outputs/{job_name}/", "")
-            size_kb = blob.size / 1024
-            size_str = f"{size_kb:.1f} KB" if size_kb < 1024 else f"{size_kb / 1024:.1f} MB"
-            created = blob.time_created.strftime("%Y-%m-%d %H:%M") if blob.time_created else "-"
-            # Show path that can be used with --topics-load
-            gcs_path = blob.name
+        runs = list(source.runs([job_name], since))
+        # Without --limit every run's files are needed, so fetch them in one listing
+        if not limit:
+            source.prefetch(runs)
+
+        rows = 0
+        for _, timestamp in runs:
+            for f in source.files(job_name, timestamp):
+                if limit and rows >= limit:
+                    break
+                relative_path = f["name"].replace(f"outputs/{job_name}/", "")
+                created = (
+                    datetime.fromisoformat(f["created"]).strftime("%Y-%m-%d %H:%M")
+                    if f["created"]
+                    else "-"
+                )
+                # Show path that can be used with --topics-load
+                table.add_row(relative_path, format_size(f["size"]), created, f["name"])
+                rows += 1
+            if limit and rows >= limit:
+                break
 
-            table.add_row(relative_path, size_str, created, gcs_path)
+        if not rows:
+            console.print(f"[yellow]No outputs found for job: {job_name}[/yellow]")
+            return
 
         console.print(table)
         console.print(f"\nTo download: dfcloud download {job_name}")
         console.print("To use as topics: dfcloud submit config.yaml --topics-load <GCS Path>")
         return
 
+    job_folders = source.jobs()
+
     # List all job folders
     if files:
-        # Show all files across all jobs
-        prefix = "outputs/"
-        blobs = list(bucket_obj.list_blobs(prefix=prefix))
-
-        if not blobs:
-            console.print("[yellow]No outputs found[/yellow]")
-            return
-
+        # Show files across all jobs, newest runs first
         table = Table(title="All Output Files")
         table.add_column("Job", style="cyan")
         table.add_column("Timestamp", style="blue")
@@ -650,40 +1989,29 @@ def outputs(job_name: str | None, files: bool):
         table.add_column("Size", justify="right")
         table.add_column("GCS Path", style="dim")
 
-        for blob in sorted(blobs, key=lambda b: b.name, reverse=True):
-            if blob.name.endswith("/"):
-                continue
-
-            parts = blob.name.replace("outputs/", "").split("/")
-            if len(parts) >= 3:
-                job = parts[0]
-                timestamp = parts[1]
-                filename = "/".join(parts[2:])
-            else:
-                continue
-
-            size_kb = blob.size / 1024
-            size_str = f"{size_kb:.1f} KB" if size_kb < 1024 else f"{size_kb / 1024:.1f} MB"
-
-            table.add_row(job, timestamp, filename, size_str, blob.name)
+        runs = list(source.runs(job_folders, since))
+        if not limit:
+            source.prefetch(runs)
+
+        rows = 0
+        for job, timestamp in runs:
+            run_prefix = f"outputs/{job}/{timestamp}/"
+            for f in source.files(job, timestamp):
+                if limit and rows >= limit:
+                    break
+                filename = f["name"][len(run_prefix) :]
+                table.add_row(job, timestamp, filename, format_size(f["size"]), f["name"])
+                rows += 1
+            if limit and rows >= limit:
+                break
+
+        if not rows:
+            console.print("[yellow]No outputs found[/yellow]")
+            return
 
         console.print(table)
     else:
         # Just list job names
-        prefix = "outputs/"
-        iterator = bucket_obj.list_blobs(prefix=prefix, delimiter="/")
-
-        job_folders = set()
-        for blob in iterator:
-            parts = blob.name.replace(prefix, "").split("/")
-            if parts[0]:
-                job_folders.add(parts[0])
-
-        for prefix_name in iterator.prefixes:
-            jn = prefix_name.replace("outputs/", "").rstrip("/")
-            if jn:
-                job_folders.add(jn)
-
         if not job_folders:
             console.print("[yellow]No outputs found[/yellow]")
             return
@@ -691,7 +2019,7 @@ def outputs(job_name: str | None, files: bool):
         table = Table(title="Available Job Outputs")
         table.add_column("Job Name", style="cyan")
 
-        for jn in sorted(job_folders):
+        for jn in job_folders:
             table.add_row(jn)
 
         console.print(table)
@@ -699,10 +2027,114 @@ def outputs(job_name: str | None, files: bool):
         console.print("To download:  dfcloud download <job-name>")
 
 
+def get_token_expiry(token: str) -> float | None:
+    """Return the exp claim of a JWT as a Unix timestamp, or None if it can't be read."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+def load_token_cache() -> dict:
+    """Load cached identity tokens, dropping any that are about to expire."""
+    try:
+        with open(TOKEN_CACHE_FILE) as f:
+            tokens = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {
+        key: entry
+        for key, entry in tokens.items()
+        if entry.get("expires_at", 0) - TOKEN_EXPIRY_MARGIN > now
+    }
+
+
+def save_token_cache(tokens: dict) -> None:
+    """Save identity tokens, readable only by the current user."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = TOKEN_CACHE_FILE.with_suffix(".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(tokens, f)
+    tmp_path.replace(TOKEN_CACHE_FILE)
+
+
+def get_credentials_identity() -> str:
+    """Describe the credentials an identity token would be fetched with.
+
+    Reads the same settings google-auth and gcloud do (the service account
+    key file, the gcloud config directory, its active configuration and
+    account) without running gcloud, so switching accounts or
+    configurations never reuses another identity's token.
+    """
+    import configparser
+
+    key_file = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+    if key_file:
+        try:
+            mtime = os.stat(key_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        return f"key:{os.path.abspath(key_file)}:{mtime}"
+
+    config_dir = Path(
+        os.environ.get("CLOUDSDK_CONFIG") or Path.home() / ".config" / "gcloud"
+    ).expanduser()
+    account = os.environ.get("CLOUDSDK_CORE_ACCOUNT")
+    if not account:
+        name = os.environ.get("CLOUDSDK_ACTIVE_CONFIG_NAME")
+        if not name:
+            try:
+                name = (config_dir / "active_config").read_text().strip()
+            except OSError:
+                name = ""
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(config_dir / "configurations" / f"config_{name or 'default'}")
+        except configparser.Error:
+            pass
+        account = parser.get("core", "account", fallback="")
+    return f"gcloud:{config_dir.resolve()}:{account}"
+
+
 def get_identity_token(audience: str) -> str:
-    """Get an identity token for authenticating with Cloud Run."""
+    """Get an identity token for authenticating with Cloud Run.
+
+    Tokens are cached in memory and on disk per credentials and audience
+    until shortly before they expire, so repeated invocations don't re-run
+    gcloud.
+    """
+    key = f"{get_credentials_identity()} {audience}"
+    entry = _identity_tokens.get(key) or load_token_cache().get(key)
+    if entry and entry["expires_at"] - TOKEN_EXPIRY_MARGIN > time.time():
+        _identity_tokens[key] = entry
+        return entry["token"]
+
+    token = fetch_identity_token(audience)
+    expires_at = get_token_expiry(token)
+    if expires_at is not None:
+        entry = {"token": token, "expires_at": expires_at}
+        _identity_tokens[key] = entry
+        try:
+            tokens = load_token_cache()
+            tokens[key] = entry
+            save_token_cache(tokens)
+        except OSError:
+            pass  # Caching is best effort
+    return token
+
+
+def fetch_identity_token(audience: str) -> str:
+    """Fetch a new identity token from Google credentials or the gcloud CLI."""
     import subprocess
 
+    from google.auth.transport.requests import Request
+    from google.oauth2 import id_token
+
     # First try the Python library (works on GCP)
     try:
         token = id_token.fetch_id_token(Request(), audience)
@@ -753,14 +2185,10 @@ def get_spin_service_url() -> str:
         sys.exit(1)
 
 
-def check_tools_available(spin_url: str, headers: dict) -> list[str]:
+def check_tools_available(session: requests.Session, spin_url: str) -> list[str]:
     """Check what tools are available in the Spin service."""
     try:
-        response = requests.get(
-            f"{spin_url}/mock/list-tools",
-            headers=headers,
-            timeout=30,
-        )
+        response = session.get(f"{spin_url}/mock/list-tools", timeout=30)
         if response.status_code == 200:
             data = response.json()
             # Handle different response formats
@@ -773,39 +2201,131 @@ def check_tools_available(spin_url: str, headers: dict) -> list[str]:
         return []
 
 
-def load_mock_responses(spin_url: str, headers: dict, mock_data: dict) -> int:
-    """Load default mock responses into Spin service."""
-    responses = mock_data.get("mockResponses", {})
-    loaded = 0
+def create_spin_session(headers: dict, workers: int) -> requests.Session:
+    """Create a session that reuses connections to Spin and retries transient failures.
 
-    for tool_name, data in responses.items():
+    add-fixture appends, so a POST is only retried when Spin can't have
+    applied it: the connection failed, or Spin refused it with 429 or 503.
+    Read timeouts and other 5xx responses are reported as failures.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=INIT_RETRIES,
+        connect=INIT_RETRIES,
+        read=0,
+        other=0,
+        status=INIT_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[429, 503],
+        allowed_methods=None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def post_items(
+    session: requests.Session,
+    url: str,
+    items: list[tuple[str, dict]],
+    workers: int,
+    description: str,
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """POST (label, payload) items with a progress bar, concurrently across tools.
+
+    Items for the same tool (payload["name"]) are posted one at a time in
+    list order, so fixtures register in Spin in file order. After a failure
+    the tool's remaining items are skipped, so what did load is always a
+    prefix of the list.
+
+    Returns the labels that loaded and a list of (label, error) for failures.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+    def post(payload: dict) -> None:
+        response = session.post(url, json=payload, timeout=30)
+        if response.status_code != 200:
+            detail = response.text[:200].strip()
+            raise RuntimeError(f"HTTP {response.status_code}" + (f": {detail}" if detail else ""))
+
+    loaded = []
+    failures = []
+    if not items:
+        return loaded, failures
+
+    by_tool = {}
+    for label, payload in items:
+        by_tool.setdefault(payload["name"], []).append((label, payload))
+
+    def post_tool(tool_items: list[tuple[str, dict]]) -> None:
+        failed = False
+        for label, payload in tool_items:
+            if failed:
+                failures.append((label, "skipped after an earlier failure for this tool"))
+            else:
+                try:
+                    post(payload)
+                    loaded.append(label)
+                except Exception as e:
+                    failures.append((label, str(e)))
+                    failed = True
+            progress.advance(task)
+
+    progress = Progress(
+        TextColumn("  {task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=get_console(),
+        transient=True,
+    )
+    with progress:
+        task = progress.add_task(description, total=len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(post_tool, by_tool.values()))
+
+    return loaded, failures
+
+
+def print_failures(failures: list[tuple[str, str]], limit: int = 10) -> None:
+    """Print per-item load failures, truncated to `limit` entries."""
+    for label, error in sorted(failures)[:limit]:
+        console.print(f"  [yellow]Warning:[/yellow] Failed to load {label}: {error}")
+    if len(failures) > limit:
+        console.print(f"  [yellow]... and {len(failures) - limit} more failures[/yellow]")
+
+
+def digest_json(value) -> str:
+    """Hash a JSON value independently of key order."""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_mock_entries(mock_data: dict) -> tuple[dict, dict]:
+    """Split mock data into response and fixture entries for diffing.
+
+    Returns (responses, fixtures). responses maps a tool to (digest, payload).
+    fixtures maps a tool to its list of (digest, payload) in file order,
+    since Spin appends fixtures and the order decides which one matches.
+    """
+    responses = {}
+    for tool_name, data in mock_data.get("mockResponses", {}).items():
         default_response = data.get("defaultResponse")
         if not default_response:
             continue
+        payload = {"name": tool_name, "mockResponse": default_response}
+        responses[tool_name] = (digest_json(payload), payload)
 
-        try:
-            response = requests.post(
-                f"{spin_url}/mock/update-response",
-                headers=headers,
-                json={"name": tool_name, "mockResponse": default_response},
-                timeout=30,
-            )
-            if response.status_code == 200:
-                loaded += 1
-            else:
-                console.print(f"  [yellow]Warning:[/yellow] Failed to load: {tool_name}")
-        except Exception as e:
-            console.print(f"  [yellow]Warning:[/yellow] Failed to load {tool_name}: {e}")
-
-    return loaded
-
-
-def load_fixtures(spin_url: str, headers: dict, mock_data: dict) -> int:
-    """Load fixtures into Spin service."""
-    fixtures = mock_data.get("fixtures", {})
-    loaded = 0
-
-    for tool_name, tool_fixtures in fixtures.items():
+    fixtures = {}
+    for tool_name, tool_fixtures in mock_data.get("fixtures", {}).items():
         for fixture in tool_fixtures:
             match = fixture.get("match")
             response = fixture.get("response")
@@ -813,19 +2333,152 @@ def load_fixtures(spin_url: str, headers: dict, mock_data: dict) -> int:
             if not match or not response:
                 continue
 
-            try:
-                resp = requests.post(
-                    f"{spin_url}/mock/add-fixture",
-                    headers=headers,
-                    json={"name": tool_name, "match": match, "response": response},
-                    timeout=30,
-                )
-                if resp.status_code == 200:
-                    loaded += 1
-            except Exception:
-                pass  # Fixtures are optional, don't warn for each
+            payload = {"name": tool_name, "match": match, "response": response}
+            fixtures.setdefault(tool_name, []).append((digest_json(payload), payload))
+
+    return responses, fixtures
+
 
-    return loaded
+def is_local_url(url: str) -> bool:
+    """Check whether a service URL points at this machine."""
+    from urllib.parse import urlparse
+
+    return urlparse(url).hostname in LOCAL_HOSTS
+
+
+def load_init_state(bucket_obj, spin_url: str) -> dict:
+    """Load the digests last applied to this Spin service, or empty state.
+
+    The state is read from the bucket, or from LOCAL_INIT_STATE_FILE when
+    bucket_obj is None.
+    """
+    try:
+        if bucket_obj is None:
+            with open(LOCAL_INIT_STATE_FILE) as f:
+                state = json.load(f)
+        else:
+            state = json.loads(bucket_obj.blob(INIT_STATE_PATH).download_as_text())
+    except Exception:
+        return {}
+    # State recorded against another deployment says nothing about this one
+    if state.get("spin_url") != spin_url or state.get("version") != INIT_STATE_VERSION:
+        return {}
+    return state
+
+
+def save_init_state(
+    bucket_obj, spin_url: str, responses: dict, fixtures: dict, probe: dict | None
+) -> None:
+    """Record the digests now applied to the Spin service."""
+    state = {
+        "version": INIT_STATE_VERSION,
+        "spin_url": spin_url,
+        "updated_at": datetime.utcnow().isoformat() + "Z",
+        "responses": responses,
+        "fixtures": fixtures,
+        "probe": probe,
+    }
+    content = json.dumps(state, indent=2, sort_keys=True)
+    if bucket_obj is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = LOCAL_INIT_STATE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(content)
+        tmp_path.replace(LOCAL_INIT_STATE_FILE)
+        return
+    bucket_obj.blob(INIT_STATE_PATH).upload_from_string(content, content_type="application/json")
+
+
+def load_changed_entries(
+    session: requests.Session,
+    url: str,
+    entries: dict,
+    applied: dict,
+    workers: int,
+    description: str,
+) -> tuple[dict, int, list[tuple[str, str]]]:
+    """Push responses whose digest differs from the applied state.
+
+    update-response replaces a tool's response, so changed entries can be
+    pushed again. Returns the digests now applied (unchanged plus newly
+    loaded entries), the number pushed, and failures. Failed entries are
+    left out of the returned digests so the next init retries them.
+    """
+    now_applied = {
+        key: digest for key, (digest, _) in entries.items() if applied.get(key) == digest
+    }
+    changed = [(key, payload) for key, (_, payload) in entries.items() if key not in now_applied]
+
+    loaded, failures = post_items(session, url, changed, workers, description)
+    for key in loaded:
+        now_applied[key] = entries[key][0]
+    return now_applied, len(loaded), failures
+
+
+def load_new_fixtures(
+    session: requests.Session,
+    url: str,
+    fixtures: dict,
+    applied: dict,
+    workers: int,
+) -> tuple[dict, int, list[tuple[str, str]], list[str]]:
+    """Push fixtures appended to each tool's list since the applied state.
+
+    Spin can only append fixtures, so a tool whose applied fixtures are still
+    the start of its list gets the rest posted. A tool whose fixtures were
+    edited, removed or reordered can't be brought up to date in place; it is
+    left as applied and reported.
+
+    Returns the digests now applied per tool, the number pushed, failures,
+    and the tools that need a restart to update.
+    """
+    now_applied = {}
+    stale = []
+    items = []
+    for tool, entries in fixtures.items():
+        digests = [digest for digest, _ in entries]
+        done = applied.get(tool, [])
+        if digests[: len(done)] != done:
+            now_applied[tool] = done
+            stale.append(tool)
+            continue
+        now_applied[tool] = list(done)
+        for index in range(len(done), len(entries)):
+            items.append((f"{tool}#{index}", entries[index][1]))
+    stale.extend(tool for tool in applied if tool not in fixtures)
+    for tool in applied:
+        now_applied.setdefault(tool, applied[tool])
+
+    loaded, failures = post_items(session, url, items, workers, "Fixtures")
+    # Each tool's loaded fixtures are a prefix of what was posted for it
+    for label in sorted(loaded, key=lambda label: int(label.rsplit("#", 1)[1])):
+        tool = label.rsplit("#", 1)[0]
+        now_applied[tool].append(fixtures[tool][int(label.rsplit("#", 1)[1])][0])
+    return now_applied, len(loaded), failures, sorted(stale)
+
+
+def get_init_probe(responses: dict, fixtures: dict) -> dict | None:
+    """Pick a tool call whose answer depends on mock data loaded into Spin.
+
+    Takes applied responses and fixtures as {tool: (digest, payload)} and
+    {tool: [payload, ...]}. A tool with a default response is called with no
+    arguments, which no fixture matches; otherwise a fixture is called with
+    its own match.
+    """
+    if responses:
+        return {"name": min(responses), "arguments": {}}
+    if fixtures:
+        tool = min(fixtures)
+        return {"name": tool, "arguments": fixtures[tool][0]["match"]}
+    return None
+
+
+def run_init_probe(session: requests.Session, spin_url: str, probe: dict) -> str | None:
+    """Call the probe tool and return a digest of Spin's answer, or None if unreachable."""
+    try:
+        response = session.post(f"{spin_url}/mock/execute", json=probe, timeout=30)
+    except Exception:
+        return None
+    return digest_json({"status": response.status_code, "body": response.text})
 
 
 def run_import_tools(spin_url: str, mcp_command: str, auth_token: str | None = None) -> bool:
@@ -898,13 +2551,42 @@ def run_import_tools(spin_url: str, mcp_command: str, auth_token: str | None = N
     is_flag=True,
     help="Upload local mock-data file to GCS before initializing",
 )
-def init(mock_data: str | None, mcp_command: str, skip_import_tools: bool, upload_first: bool):
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=INIT_MAX_WORKERS,
+    show_default=True,
+    help="Concurrent requests when loading mock data",
+)
+@click.option("--full", is_flag=True, help="Reload all mock data, not only what changed")
+def init(
+    mock_data: str | None,
+    mcp_command: str,
+    skip_import_tools: bool,
+    upload_first: bool,
+    workers: int,
+    full: bool,
+):
     """Initialize Spin service with tools and mock data.
 
     This command:
     1. Runs deepfabric import-tools to register tools from the MCP server
     2. Loads mock responses into the Spin service
 
+    Only mock responses and fixtures that changed since the last init are
+    pushed; the digests of what was loaded are kept in the bucket at
+    init/applied-state.json. A probe tool call detects a Spin service that
+    restarted and lost that data, and everything is then reloaded.
+
+    A Spin service on localhost (deepfabric-job/local_spin.py) is loaded
+    without an identity token or the bucket: --mock-data is required and the
+    state is kept in ~/.dfcloud/cache/local-init-state.json.
+
+    Spin can't unload mock data, so removed responses and edited, removed or
+    reordered fixtures only take effect after restarting the Spin service
+    and running init with --full.
+
     Run this after deploying infrastructure, from Cloud Shell or a GCP environment.
 
     Prerequisites:
@@ -924,29 +2606,47 @@ def init(mock_data: str | None, mcp_command: str, skip_import_tools: bool, uploa
 
         # Upload mock data to GCS first
         dfcloud init --upload-first --mock-data mock.json
-    """
-    project_id = get_config_value("project_id")
-    bucket = get_config_value("bucket")
 
+        # Reload everything, e.g. after redeploying Spin
+        dfcloud init --skip-import-tools --full
+
+        # Load a local Spin stand-in, offline
+        dfcloud init --skip-import-tools --mock-data mock-data.json
+    """
     console.print("[bold]Initializing Spin service...[/bold]\n")
 
     # Get Spin service URL
     spin_url = get_spin_service_url()
     console.print(f"Spin service: {spin_url}")
 
-    # Get identity token for authentication
-    console.print("Getting authentication token...")
-    token = get_identity_token(spin_url)
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
+    # A local stand-in takes no token and keeps no state in the bucket
+    local = is_local_url(spin_url)
+    if local and not mock_data:
+        console.print("[red]Error:[/red] --mock-data is required for a local Spin service")
+        sys.exit(1)
 
-    # Handle file upload to GCS if requested
-    storage_client = storage.Client(project=project_id)
-    bucket_obj = storage_client.bucket(bucket)
+    headers = {"Content-Type": "application/json"}
+    token = None
+    if not local:
+        # Get identity token for authentication
+        console.print("Getting authentication token...")
+        token = get_identity_token(spin_url)
+        headers["Authorization"] = f"Bearer {token}"
+    session = create_spin_session(headers, workers)
+
+    bucket_obj = None
+    if not local:
+        from google.cloud import storage
+
+        project_id = get_config_value("project_id")
+        bucket = get_config_value("bucket")
+        storage_client = storage.Client(project=project_id)
+        bucket_obj = storage_client.bucket(bucket)
+    elif upload_first:
+        console.print("  [yellow]Warning:[/yellow] --upload-first ignored for a local Spin service")
 
-    if upload_first and mock_data:
+    # Handle file upload to GCS if requested
+    if upload_first and mock_data and bucket_obj is not None:
         console.print("Uploading mock data to GCS...")
         blob = bucket_obj.blob("init/mock-data.json")
         blob.upload_from_filename(mock_data)
@@ -986,27 +2686,98 @@ def init(mock_data: str | None, mcp_command: str, skip_import_tools: bool, uploa
 
     # Check available tools in Spin
     console.print("\nChecking available tools in Spin service...")
-    available_tools = check_tools_available(spin_url, headers)
+    available_tools = check_tools_available(session, spin_url)
     if available_tools:
         console.print(f"  Found {len(available_tools)} tools available")
     else:
         console.print("  [yellow]Warning:[/yellow] No tools found. Import may have failed.")
 
+    responses, fixtures = get_mock_entries(mock_data_content)
+    state = {} if full else load_init_state(bucket_obj, spin_url)
+
+    # Spin keeps mock data in memory, so a restart or redeploy at the same
+    # URL loses it. The probe's answer differs from the recorded one then.
+    probe = state.get("probe")
+    if probe:
+        digest = run_init_probe(session, spin_url, probe["call"])
+        if digest is None:
+            console.print(
+                "  [yellow]Warning:[/yellow] Could not check the Spin service's mock data; "
+                "assuming it is unchanged since the last init"
+            )
+        elif digest != probe["digest"]:
+            console.print("  Spin service no longer has the last loaded mock data; reloading all")
+            state = {}
+
     # Load mock responses
     console.print("Loading mock responses...")
-    responses_count = len(mock_data_content.get("mockResponses", {}))
-    responses_loaded = load_mock_responses(spin_url, headers, mock_data_content)
-    console.print(f"  Loaded {responses_loaded}/{responses_count} mock responses")
+    applied_responses, pushed, failures = load_changed_entries(
+        session,
+        f"{spin_url}/mock/update-response",
+        responses,
+        state.get("responses", {}),
+        workers,
+        "Mock responses",
+    )
+    unchanged = len(applied_responses) - pushed
+    console.print(f"  Loaded {pushed} mock responses ({unchanged} unchanged)")
+    print_failures(failures)
 
     # Load fixtures
     console.print("Loading fixtures...")
-    fixtures_loaded = load_fixtures(spin_url, headers, mock_data_content)
-    console.print(f"  Loaded {fixtures_loaded} fixtures")
+    applied_fixtures, pushed, failures, stale_tools = load_new_fixtures(
+        session,
+        f"{spin_url}/mock/add-fixture",
+        fixtures,
+        state.get("fixtures", {}),
+        workers,
+    )
+    unchanged = sum(len(digests) for digests in applied_fixtures.values()) - pushed
+    console.print(f"  Loaded {pushed} fixtures ({unchanged} unchanged)")
+    print_failures(failures)
+
+    # Spin has no endpoint to unload an entry. Removed responses keep their
+    # digests in the state, so this is reported until a full reload.
+    removed_responses = sorted(set(state.get("responses", {})) - set(responses))
+    for tool in removed_responses:
+        applied_responses[tool] = state["responses"][tool]
+    stale = [f"{tool} (response removed)" for tool in removed_responses]
+    stale += [f"{tool} (fixtures changed)" for tool in stale_tools]
+    if stale:
+        console.print(
+            f"  [yellow]Warning:[/yellow] {len(stale)} tools changed in ways Spin can't apply "
+            "in place:"
+        )
+        for label in stale[:10]:
+            console.print(f"    {label}")
+        console.print(
+            "  Restart the Spin service, then run: dfcloud init --skip-import-tools --full"
+        )
+
+    # Probe with entries that are loaded, so its answer is stable until a restart
+    new_probe = None
+    probe_call = get_init_probe(
+        {tool: responses[tool] for tool in applied_responses if tool in responses},
+        {
+            tool: [payload for _, payload in fixtures[tool][: len(digests)]]
+            for tool, digests in applied_fixtures.items()
+            if digests and tool not in stale_tools
+        },
+    )
+    if probe_call:
+        digest = run_init_probe(session, spin_url, probe_call)
+        if digest:
+            new_probe = {"call": probe_call, "digest": digest}
+
+    try:
+        save_init_state(bucket_obj, spin_url, applied_responses, applied_fixtures, new_probe)
+    except Exception as e:
+        console.print(f"  [yellow]Warning:[/yellow] Could not save init state: {e}")
 
     # Verify with a health check
     console.print("\nVerifying Spin service...")
     try:
-        response = requests.get(f"{spin_url}/vfs/health", headers=headers, timeout=10)
+        response = session.get(f"{spin_url}/vfs/health", timeout=10)
         if response.status_code == 200:
             console.print("  [green]Health check passed[/green]")
         else:
@@ -1021,12 +2792,7 @@ def init(mock_data: str | None, mcp_command: str, skip_import_tools: bool, uploa
             "name": "ai_optimization_keyword_data_locations_and_languages",
             "arguments": {},
         }
-        response = requests.post(
-            f"{spin_url}/mock/execute",
-            headers=headers,
-            json=test_payload,
-            timeout=30,
-        )
+        response = session.post(f"{spin_url}/mock/execute", json=test_payload, timeout=30)
         if response.status_code == 200:
             console.print("  [green]Tool execution test passed[/green]")
         else:
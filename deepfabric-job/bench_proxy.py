@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Auth proxy throughput benchmark
+
+Starts a local upstream that answers every request after a fixed delay,
+points the auth proxy at it, and measures requests/second for increasing
+numbers of concurrent clients.
+
+Proxy pool and cache settings are read from the same environment variables
+as the job (PROXY_POOL_SIZE, PROXY_EXECUTE_CACHE_BYTES, ...).
+
+Usage:
+    python bench_proxy.py
+    python bench_proxy.py --latency 0.1 --requests 400 --workers 16
+    PROXY_EXECUTE_CACHE_BYTES=10000000 python bench_proxy.py
+
+    # Benchmark against a running local Spin stand-in (see local_spin.py)
+    python bench_proxy.py --upstream http://127.0.0.1:8080 --tool my_tool
+"""
+
+import argparse
+import http.server
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import entrypoint
+
+
+class SlowUpstreamHandler(http.server.BaseHTTPRequestHandler):
+    """Upstream stand-in that sleeps before returning a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.05
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        content_length = int(self.headers.get("Content-Length", 0))
+        if content_length:
+            self.rfile.read(content_length)
+        self._respond()
+
+    def _respond(self):
+        time.sleep(self.latency)
+        body = b'{"result": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_clients(url: str, clients: int, total_requests: int, tool: str = "bench") -> float:
+    """Issue total_requests POSTs from `clients` threads. Returns requests/second."""
+    payload = json.dumps({"name": tool, "arguments": {}}).encode()
+
+    def call(_):
+        req = urllib.request.Request(
+            url,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=60) as response:
+            response.read()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(call, range(total_requests)))
+    return total_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark auth proxy concurrency")
+    parser.add_argument("--latency", type=float, default=0.05, help="Upstream delay in seconds")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per concurrency level")
+    parser.add_argument("--workers", type=int, default=None, help="Proxy worker limit")
+    parser.add_argument(
+        "--clients",
+        default="1,2,4,8,16,32",
+        help="Comma-separated concurrency levels",
+    )
+    parser.add_argument("--upstream", help="Use a running server (e.g. local_spin.py) as upstream")
+    parser.add_argument("--tool", default="bench", help="Tool name to execute")
+    args = parser.parse_args()
+
+    upstream = None
+    if args.upstream:
+        upstream_url = args.upstream.rstrip("/")
+    else:
+        SlowUpstreamHandler.latency = args.latency
+        upstream = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowUpstreamHandler)
+        threading.Thread(target=upstream.serve_forever, daemon=True).start()
+        upstream_url = f"http://127.0.0.1:{upstream.server_address[1]}"
+
+    # Point the proxy at the upstream without going through the metadata server
+    entrypoint._spin_endpoint = upstream_url
+    entrypoint._auth_token = "bench-token"
+    entrypoint.init_proxy_clients(entrypoint._spin_endpoint)
+
+    max_workers = args.workers or entrypoint.get_proxy_max_workers()
+    proxy = entrypoint.ThreadPoolTCPServer(
+        ("127.0.0.1", 0), entrypoint.AuthProxyHandler, max_workers=max_workers
+    )
+    threading.Thread(target=proxy.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{proxy.server_address[1]}/mock/execute"
+
+    if upstream:
+        print(f"Upstream latency: {args.latency * 1000:.0f} ms, proxy workers: {max_workers}")
+    else:
+        print(f"Upstream: {upstream_url}, proxy workers: {max_workers}")
+    print(f"{'clients':>8}  {'req/s':>10}  {'speedup':>8}")
+
+    baseline = None
+    for clients in (int(c) for c in args.clients.split(",")):
+        rate = run_clients(url, clients, args.requests, args.tool)
+        baseline = baseline or rate
+        print(f"{clients:>8}  {rate:>10.1f}  {rate / baseline:>7.1f}x")
+
+    print()
+    entrypoint.print_proxy_stats()
+
+    proxy.shutdown()
+    proxy.server_close()
+    if upstream:
+        upstream.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,33 +9,150 @@ Supports two modes:
 Set JOB_MODE environment variable to control which mode to run.
 """
 
+import base64
+import contextlib
+import email.utils
+import gzip
+import hashlib
+import http.client
 import http.server
 import json
 import os
+import queue
+import random
+import re
 import socketserver
 import subprocess
 import sys
 import tempfile
 import threading
 import time
+import urllib.parse
 import urllib.request
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import requests
 import yaml
+from google.api_core import exceptions as gcs_exceptions
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 
 
 # Global for auth proxy
 _spin_endpoint = None
 _auth_token = None
 _token_obtained_at = 0
-_token_lock = threading.Lock()
+_token_refresh_stop = threading.Event()
+_upstream_pool = None
+_tools_cache = None
+_execute_cache = None
 
-# Refresh token every 45 minutes (tokens expire after ~1 hour)
+# Shared GCS client, created on first use
+_storage_client = None
+_storage_client_lock = threading.Lock()
+
+# Background Slack sender, created on first notification
+_slack_notifier = None
+_slack_notifier_lock = threading.Lock()
+
+# Progress of the running deepfabric process, fed by its output and the auth proxy
+_progress_tracker = None
+
+# Refresh token every 45 minutes when its expiry can't be read (tokens expire after ~1 hour)
 TOKEN_REFRESH_INTERVAL = 45 * 60
 
+# Renew the token this long before its exp claim, and retry this often after a failed refresh
+TOKEN_REFRESH_MARGIN = 5 * 60
+TOKEN_RETRY_INTERVAL = 30
+
+# Spin endpoints on this machine (e.g. local_spin.py) take no identity token
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+# Default number of proxied requests handled concurrently
+DEFAULT_PROXY_MAX_WORKERS = 32
+
+# Default upstream keep-alive pool: max idle connections and seconds before an idle one is dropped
+DEFAULT_PROXY_POOL_SIZE = 32
+DEFAULT_PROXY_POOL_IDLE_TIMEOUT = 60
+
+# Seconds a cached /list-tools response is served before revalidating with Spin
+DEFAULT_TOOLS_CACHE_TTL = 300
+
+# Byte budget for memoized /mock/execute responses (0 disables the cache)
+DEFAULT_EXECUTE_CACHE_BYTES = 0
+
+# Read size when relaying upstream response bodies to the client
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# GCS compose accepts at most 32 source objects per request
+GCS_COMPOSE_LIMIT = 32
+
+# Marker object a shard writes after it generated and uploaded its outputs successfully
+SHARD_SUCCESS_MARKER = "_SUCCESS"
+
+# Lock object the merging shard holds. A lock left "merging" for longer than
+# the lease by a task that died is reclaimed.
+SHARD_MERGE_LOCK = "_MERGE_LOCK"
+MERGE_LOCK_LEASE = 900
+
+# Default seconds between incremental dataset checkpoint uploads (0 disables checkpointing)
+DEFAULT_CHECKPOINT_INTERVAL = 300
+
+# Lines of deepfabric output kept in memory for error messages and progress parsing
+LOG_TAIL_LINES = 200
+
+# Compressed full deepfabric log, uploaded next to the outputs
+LOG_FILE_NAME = "deepfabric.log.gz"
+
+# Default seconds deepfabric may go without printing before it is killed (0 disables)
+DEFAULT_IDLE_TIMEOUT = 3600
+
+# Lines of deepfabric output buffered between the reader thread and the main loop
+OUTPUT_QUEUE_SIZE = 10000
+
+# Seconds between forwarding batches of output, and so between timeout checks
+OUTPUT_FLUSH_INTERVAL = 0.5
+
+# Default seconds between progress status uploads (0 disables them)
+DEFAULT_PROGRESS_STATUS_INTERVAL = 30
+
+# Progress status objects, one per task: progress/{execution}/task-{index}.json
+PROGRESS_STATUS_PREFIX = "progress"
+
+# Seconds of sample counts used for the current rate, and tool calls kept for percentiles
+PROGRESS_RATE_WINDOW = 300
+PROGRESS_LATENCY_SAMPLES = 1000
+
+# deepfabric --tui simple sample progress, e.g. "Step 244: +4 (total 976/10000)"
+SAMPLES_PATTERN = re.compile(r"total\s+(\d+)/(\d+)")
+ERROR_PATTERN = re.compile(r"\b(error|exception|traceback)\b", re.IGNORECASE)
+
+# Output files uploaded concurrently at the end of a run
+UPLOAD_MAX_WORKERS = 8
+
+# Files larger than this are uploaded as concurrent parts of one multipart upload
+PARALLEL_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Bucket-wide index of runs and their output files, one JSON record per line.
+# Records are sharded by the month of the run so each append rewrites one
+# bounded object: catalog/runs-YYYY-MM.jsonl
+CATALOG_PREFIX = "catalog/"
+CATALOG_WRITE_ATTEMPTS = 5
+
+# Slack messages waiting to be sent; once full, new messages are dropped
+SLACK_QUEUE_SIZE = 100
+
+# Attempts per Slack message, and the backoff cap between attempts
+SLACK_MAX_ATTEMPTS = 5
+SLACK_MAX_BACKOFF = 60
+
+# Seconds to wait for queued Slack messages when the job exits
+SLACK_FLUSH_TIMEOUT = 30
+
 
 def transform_tools_response(data: dict) -> dict:
     """Transform Spin's tool format to MCP-compatible format."""
@@ -79,95 +196,586 @@ def transform_tools_response(data: dict) -> dict:
     return {"tools": transformed_tools}
 
 
+def transform_tools_body(body: bytes) -> bytes:
+    """Transform a raw /list-tools response body, keeping the original if it can't be parsed."""
+    try:
+        data = json.loads(body)
+        data = transform_tools_response(data)
+        return json.dumps(data).encode()
+    except Exception:
+        return body  # Keep original if transform fails
+
+
+class UpstreamConnectionPool:
+    """Thread-safe pool of persistent HTTP/1.1 connections to the Spin service.
+
+    Connections are kept alive between proxied requests so each tool call
+    reuses an open TLS session instead of doing a fresh handshake.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_size: int = DEFAULT_PROXY_POOL_SIZE,
+        idle_timeout: float = DEFAULT_PROXY_POOL_IDLE_TIMEOUT,
+        timeout: float = 60,
+    ):
+        parsed = urllib.parse.urlsplit(base_url)
+        self._https = parsed.scheme == "https"
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._base_path = parsed.path.rstrip("/")
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._timeout = timeout
+        self._idle: list[tuple[http.client.HTTPConnection, float]] = []
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "expired": 0, "retried": 0}
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._https:
+            connection_class = http.client.HTTPSConnection
+        else:
+            connection_class = http.client.HTTPConnection
+        with self._lock:
+            self.stats["created"] += 1
+        return connection_class(self._host, self._port, timeout=self._timeout)
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused), preferring the most recently used idle connection."""
+        with self._lock:
+            now = time.monotonic()
+            while self._idle:
+                conn, last_used = self._idle.pop()
+                if now - last_used < self._idle_timeout:
+                    self.stats["reused"] += 1
+                    return conn, True
+                conn.close()
+                self.stats["expired"] += 1
+        return self._new_connection(), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._max_size:
+                self._idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    @contextlib.contextmanager
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: dict | None = None,
+    ):
+        """Send a request upstream and yield the response.
+
+        The connection goes back to the pool only if the response body was
+        fully read and the server did not ask to close it.
+        """
+        url = f"{self._base_path}{path}"
+        headers = headers or {}
+        conn, reused = self._acquire()
+        try:
+            conn.request(method, url, body=body, headers=headers)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry once on a fresh one
+            with self._lock:
+                self.stats["retried"] += 1
+            conn = self._new_connection()
+            try:
+                conn.request(method, url, body=body, headers=headers)
+                response = conn.getresponse()
+            except Exception:
+                conn.close()
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+        try:
+            yield response
+        except Exception:
+            conn.close()
+            raise
+        if response.isclosed() and not response.will_close:
+            self._release(conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            conn.close()
+
+
+class ToolsListCache:
+    """Cache of transformed /list-tools responses keyed by request path.
+
+    Each entry remembers the upstream ETag so that, once the TTL has passed,
+    the proxy can revalidate with a conditional GET instead of re-fetching
+    and re-transforming the whole tool list.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TOOLS_CACHE_TTL):
+        self._ttl = ttl
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0}
+
+    def lookup(self, path: str) -> tuple[dict | None, bool]:
+        """Return (entry, fresh) for a path. Counts a hit when the entry is fresh."""
+        with self._lock:
+            entry = self._entries.get(path)
+            fresh = entry is not None and time.monotonic() - entry["stored_at"] < self._ttl
+            if fresh:
+                self.stats["hits"] += 1
+            else:
+                self.stats["misses"] += 1
+            return entry, fresh
+
+    def store(self, path: str, etag: str | None, body: bytes, content_type: str) -> None:
+        with self._lock:
+            self._entries[path] = {
+                "etag": etag,
+                "body": body,
+                "content_type": content_type,
+                "stored_at": time.monotonic(),
+            }
+
+    def revalidated(self, path: str) -> None:
+        """Mark an entry fresh again after Spin answered 304 Not Modified."""
+        with self._lock:
+            if path in self._entries:
+                self._entries[path]["stored_at"] = time.monotonic()
+                self.stats["revalidated"] += 1
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Drop one cached path, or every entry when path is None."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+class ExecuteResponseCache:
+    """Byte-bounded LRU of /mock/execute responses.
+
+    Mock executions are deterministic for a given tool name and arguments,
+    so responses are keyed by a SHA-256 of the canonical JSON request body.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @staticmethod
+    def key_for(body: bytes | None) -> str | None:
+        """Hash the request body with keys sorted, or None if it isn't JSON."""
+        if not body:
+            return None
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[bytes, str] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry
+
+    def put(self, key: str, body: bytes, content_type: str) -> None:
+        if len(body) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+            self._entries[key] = (body, content_type)
+            self._size += len(body)
+            while self._size > self._max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.stats["evictions"] += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def invalidate_tools_cache() -> None:
+    """Drop all cached /list-tools responses (e.g. after the tool schema changes)."""
+    if _tools_cache is not None:
+        _tools_cache.invalidate()
+        print("Auth proxy tools cache invalidated")
+
+
+def invalidate_execute_cache() -> None:
+    """Drop all memoized /mock/execute responses (e.g. after mock data or fixtures change)."""
+    if _execute_cache is not None:
+        _execute_cache.invalidate()
+        print("Auth proxy execute cache invalidated")
+
+
 class AuthProxyHandler(http.server.BaseHTTPRequestHandler):
     """HTTP proxy that adds auth headers to requests to Spin service."""
 
+    # Local control path handled by the proxy itself, never forwarded to Spin
+    INVALIDATE_PATH = "/_proxy/invalidate"
+
     def do_GET(self):
         self._proxy_request("GET")
 
     def do_POST(self):
+        if self.path == self.INVALIDATE_PATH:
+            invalidate_tools_cache()
+            invalidate_execute_cache()
+            self._send_body(200, b'{"invalidated": true}', "application/json")
+            return
         self._proxy_request("POST")
 
     def _proxy_request(self, method):
-        global _spin_endpoint, _auth_token, _token_obtained_at, _token_lock
-
-        # Refresh token if needed
-        with _token_lock:
-            if time.time() - _token_obtained_at > TOKEN_REFRESH_INTERVAL:
-                print("Refreshing auth token...")
-                new_token = get_identity_token(_spin_endpoint)
-                if new_token:
-                    _auth_token = new_token
-                    _token_obtained_at = time.time()
-                    print("Auth token refreshed successfully")
-                else:
-                    print("Warning: Failed to refresh auth token")
-
-        # Build target URL
-        target_url = f"{_spin_endpoint.rstrip('/')}{self.path}"
-
         # Read request body if present
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length) if content_length > 0 else None
 
-        # Build headers with auth
-        headers = {"Authorization": f"Bearer {_auth_token}"}
+        # Build headers with auth (the token is swapped in by the background refresher)
+        headers = {"Authorization": f"Bearer {_auth_token}"} if _auth_token else {}
         if self.headers.get("Content-Type"):
             headers["Content-Type"] = self.headers["Content-Type"]
 
+        self._headers_sent = False
+        started_at = time.monotonic()
         try:
-            req = urllib.request.Request(target_url, data=body, headers=headers, method=method)
-            with urllib.request.urlopen(req, timeout=60) as response:
-                response_body = response.read()
-
-                # Transform tools list response to MCP format
-                if "/list-tools" in self.path:
-                    try:
-                        data = json.loads(response_body)
-                        data = transform_tools_response(data)
-                        response_body = json.dumps(data).encode()
-                    except Exception:
-                        pass  # Keep original if transform fails
-
-                self.send_response(response.status)
-                self.send_header("Content-Type", "application/json")
-                self.send_header("Content-Length", len(response_body))
-                self.end_headers()
-                self.wfile.write(response_body)
-        except urllib.error.HTTPError as e:
-            self.send_response(e.code)
-            self.end_headers()
-            self.wfile.write(e.read())
+            if "/list-tools" in self.path:
+                # Tool listings are rewritten to MCP format, so they are buffered
+                if method == "GET" and _tools_cache is not None:
+                    status, response_body, content_type = self._fetch_tools_list(headers)
+                else:
+                    status, response_body, content_type = self._forward(method, body, headers)
+                    if status == 200:
+                        response_body = transform_tools_body(response_body)
+                self._send_body(status, response_body, content_type)
+            elif method == "POST" and "/execute" in self.path and _execute_cache is not None:
+                self._fetch_execute(body, headers)
+            else:
+                self._stream(method, body, headers)
         except Exception as e:
+            if self._headers_sent:
+                # Too late for an error status; drop the connection so the client sees a short read
+                self.close_connection = True
+                return
             self.send_response(500)
             self.end_headers()
             self.wfile.write(str(e).encode())
+        finally:
+            if "/execute" in self.path and _progress_tracker is not None:
+                _progress_tracker.record_tool_call(time.monotonic() - started_at)
+
+    def _forward(self, method: str, body: bytes | None, headers: dict) -> tuple[int, bytes, str]:
+        """Send the request to Spin and return (status, body, content type)."""
+        with _upstream_pool.request(method, self.path, body=body, headers=headers) as response:
+            response_body = response.read()
+        content_type = response.getheader("Content-Type") or "application/json"
+        return response.status, response_body, content_type
+
+    def _stream(
+        self,
+        method: str,
+        body: bytes | None,
+        headers: dict,
+        cache_key: str | None = None,
+    ) -> None:
+        """Relay the upstream response to the client in chunks without buffering it.
+
+        When cache_key is given, a 200 response that fits the execute cache is
+        also collected and memoized.
+        """
+        with _upstream_pool.request(method, self.path, body=body, headers=headers) as response:
+            status = response.status
+            content_type = response.getheader("Content-Type") or "application/json"
+            self._invalidate_caches(status)
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            if response.getheader("Content-Length") is not None:
+                self.send_header("Content-Length", response.getheader("Content-Length"))
+            else:
+                # No length to forward; the end of the body is marked by closing the connection
+                self.close_connection = True
+            self.end_headers()
+            self._headers_sent = True
+
+            collected = [] if cache_key is not None and status == 200 else None
+            collected_size = 0
+            while chunk := response.read(STREAM_CHUNK_SIZE):
+                self.wfile.write(chunk)
+                if collected is not None:
+                    collected_size += len(chunk)
+                    if collected_size > _execute_cache.max_bytes:
+                        collected = None
+                    else:
+                        collected.append(chunk)
+
+        if collected is not None:
+            _execute_cache.put(cache_key, b"".join(collected), content_type)
+
+    def _invalidate_caches(self, status: int) -> None:
+        """Drop cached responses made stale by a successful mock data update."""
+        if status != 200:
+            return
+        # A new schema makes any cached tool listing or execution stale
+        if "/load-schema" in self.path:
+            invalidate_tools_cache()
+            invalidate_execute_cache()
+        elif "/update-response" in self.path or "/add-fixture" in self.path:
+            invalidate_execute_cache()
+
+    def _fetch_execute(self, body: bytes | None, headers: dict) -> None:
+        """Serve a tool execution from the memo cache, falling back to Spin on a miss."""
+        key = ExecuteResponseCache.key_for(body)
+        if key is not None:
+            cached = _execute_cache.get(key)
+            if cached is not None:
+                self._send_body(200, cached[0], cached[1])
+                return
+
+        self._stream("POST", body, headers, cache_key=key)
+
+    def _fetch_tools_list(self, headers: dict) -> tuple[int, bytes, str]:
+        """Serve /list-tools from the cache, revalidating with Spin once the entry is stale."""
+        entry, fresh = _tools_cache.lookup(self.path)
+        if fresh:
+            return 200, entry["body"], entry["content_type"]
+
+        request_headers = dict(headers)
+        if entry and entry["etag"]:
+            request_headers["If-None-Match"] = entry["etag"]
+
+        with _upstream_pool.request("GET", self.path, headers=request_headers) as response:
+            response_body = response.read()
+
+        if response.status == 304 and entry:
+            _tools_cache.revalidated(self.path)
+            return 200, entry["body"], entry["content_type"]
+
+        content_type = response.getheader("Content-Type") or "application/json"
+        if response.status == 200:
+            response_body = transform_tools_body(response_body)
+            _tools_cache.store(self.path, response.getheader("ETag"), response_body, content_type)
+        return response.status, response_body, content_type
+
+    def _send_body(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", len(body))
+        self.end_headers()
+        self._headers_sent = True
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         # Suppress default logging
         pass
 
 
-def start_auth_proxy(spin_endpoint: str, port: int = 3000) -> threading.Thread:
-    """Start a local proxy that adds auth to requests to Spin service."""
-    global _spin_endpoint, _auth_token, _token_obtained_at
+class ThreadPoolTCPServer(socketserver.TCPServer):
+    """TCP server that handles each connection on a bounded pool of worker threads."""
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, max_workers: int = DEFAULT_PROXY_MAX_WORKERS):
+        super().__init__(server_address, handler_class)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="auth-proxy",
+        )
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_proxy_max_workers() -> int:
+    """Get the auth proxy worker limit from environment. Default 32."""
+    return int(os.environ.get("PROXY_MAX_WORKERS", str(DEFAULT_PROXY_MAX_WORKERS)))
+
+
+def get_proxy_pool_size() -> int:
+    """Get the upstream keep-alive pool size from environment. Default 32."""
+    return int(os.environ.get("PROXY_POOL_SIZE", str(DEFAULT_PROXY_POOL_SIZE)))
 
-    _spin_endpoint = spin_endpoint
-    _auth_token = get_identity_token(spin_endpoint)
-    _token_obtained_at = time.time()
 
-    if not _auth_token:
-        print("Warning: Could not get identity token for auth proxy")
+def get_proxy_pool_idle_timeout() -> float:
+    """Get seconds an idle upstream connection is kept from environment. Default 60."""
+    return float(os.environ.get("PROXY_POOL_IDLE_TIMEOUT", str(DEFAULT_PROXY_POOL_IDLE_TIMEOUT)))
+
+
+def get_tools_cache_ttl() -> float:
+    """Get the /list-tools cache TTL in seconds from environment. Default 300, 0 disables."""
+    return float(os.environ.get("PROXY_TOOLS_CACHE_TTL", str(DEFAULT_TOOLS_CACHE_TTL)))
+
+
+def get_execute_cache_bytes() -> int:
+    """Get the /mock/execute memo cache size in bytes from environment. Default 0 (disabled)."""
+    return int(os.environ.get("PROXY_EXECUTE_CACHE_BYTES", str(DEFAULT_EXECUTE_CACHE_BYTES)))
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Return the exp claim of a JWT as a Unix timestamp, or None if it can't be read."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:
         return None
 
-    server = socketserver.TCPServer(("", port), AuthProxyHandler)
+
+def _next_token_refresh_delay(token: str) -> float:
+    """Seconds to wait before renewing a token, based on its exp claim."""
+    expiry = get_token_expiry(token)
+    if expiry is None:
+        return TOKEN_REFRESH_INTERVAL
+    return max(expiry - time.time() - TOKEN_REFRESH_MARGIN, TOKEN_RETRY_INTERVAL)
+
+
+def _token_refresh_loop() -> None:
+    """Renew the proxy's identity token ahead of expiry until asked to stop."""
+    global _auth_token, _token_obtained_at
+
+    delay = _next_token_refresh_delay(_auth_token)
+    while not _token_refresh_stop.wait(delay):
+        print("Refreshing auth token...")
+        new_token = get_identity_token(_spin_endpoint)
+        if new_token:
+            # Rebinding the global is atomic, so in-flight requests keep the old token
+            _auth_token = new_token
+            _token_obtained_at = time.time()
+            delay = _next_token_refresh_delay(new_token)
+            print(f"Auth token refreshed successfully, next refresh in {delay / 60:.0f} minutes")
+        else:
+            delay = TOKEN_RETRY_INTERVAL
+            print(f"Warning: Failed to refresh auth token, retrying in {delay} seconds")
+
+
+def start_token_refresher() -> threading.Thread:
+    """Start the background thread that keeps the proxy's identity token fresh."""
+    _token_refresh_stop.clear()
+    thread = threading.Thread(target=_token_refresh_loop, name="token-refresher", daemon=True)
+    thread.start()
+    return thread
+
+
+def init_proxy_clients(spin_endpoint: str) -> None:
+    """Create the upstream connection pool and response caches from environment settings."""
+    global _upstream_pool, _tools_cache, _execute_cache
+
+    _upstream_pool = UpstreamConnectionPool(
+        spin_endpoint,
+        max_size=get_proxy_pool_size(),
+        idle_timeout=get_proxy_pool_idle_timeout(),
+    )
+    tools_cache_ttl = get_tools_cache_ttl()
+    _tools_cache = ToolsListCache(ttl=tools_cache_ttl) if tools_cache_ttl > 0 else None
+    execute_cache_bytes = get_execute_cache_bytes()
+    _execute_cache = ExecuteResponseCache(execute_cache_bytes) if execute_cache_bytes > 0 else None
+
+
+def start_auth_proxy(
+    spin_endpoint: str,
+    port: int = 3000,
+    max_workers: int | None = None,
+) -> threading.Thread:
+    """Start a local proxy that adds auth to requests to Spin service.
+
+    A Spin endpoint on this machine is proxied without an identity token.
+    """
+    global _spin_endpoint, _auth_token, _token_obtained_at
+
+    _spin_endpoint = spin_endpoint
+    local = urllib.parse.urlparse(spin_endpoint).hostname in LOCAL_HOSTS
+    if not local:
+        _auth_token = get_identity_token(spin_endpoint)
+        _token_obtained_at = time.time()
+        if not _auth_token:
+            print("Warning: Could not get identity token for auth proxy")
+            return None
+
+    init_proxy_clients(spin_endpoint)
+    if not local:
+        start_token_refresher()
+
+    max_workers = max_workers or get_proxy_max_workers()
+    server = ThreadPoolTCPServer(("", port), AuthProxyHandler, max_workers=max_workers)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
-    print(f"Auth proxy started on localhost:{port} -> {spin_endpoint}")
-    print(f"Token will refresh every {TOKEN_REFRESH_INTERVAL // 60} minutes")
+    print(f"Auth proxy started on localhost:{port} -> {spin_endpoint} ({max_workers} workers)")
+    if local:
+        print("Local Spin endpoint; requests are proxied without an identity token")
+    else:
+        refresh_delay = _next_token_refresh_delay(_auth_token)
+        print(f"Token will refresh in the background in {refresh_delay / 60:.0f} minutes")
     return thread
 
 
+def print_proxy_stats() -> None:
+    """Print auth proxy counters collected during the run."""
+    if _upstream_pool is None:
+        return
+    stats = _upstream_pool.stats
+    print(
+        f"Auth proxy upstream connections: {stats['created']} opened, "
+        f"{stats['reused']} reused, {stats['expired']} expired, {stats['retried']} retried"
+    )
+    if _tools_cache is not None:
+        stats = _tools_cache.stats
+        print(
+            f"Auth proxy tools cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['revalidated']} revalidated"
+        )
+    if _execute_cache is not None:
+        stats = _execute_cache.stats
+        print(
+            f"Auth proxy execute cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evictions"
+        )
+
+
 def get_env(name: str, required: bool = True) -> str | None:
     """Get environment variable."""
     value = os.environ.get(name)
@@ -176,9 +784,19 @@ def get_env(name: str, required: bool = True) -> str | None:
     return value
 
 
+def get_storage_client() -> storage.Client:
+    """Get the process-wide GCS client."""
+    global _storage_client
+
+    with _storage_client_lock:
+        if _storage_client is None:
+            _storage_client = storage.Client()
+        return _storage_client
+
+
 def download_from_gcs(bucket_name: str, blob_path: str, local_path: Path) -> None:
     """Download a file from GCS."""
-    client = storage.Client()
+    client = get_storage_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_path)
     blob.download_to_filename(str(local_path))
@@ -186,11 +804,24 @@ def download_from_gcs(bucket_name: str, blob_path: str, local_path: Path) -> Non
 
 
 def upload_to_gcs(local_path: Path, bucket_name: str, blob_path: str) -> str:
-    """Upload a file to GCS. Returns the gs:// URL."""
-    client = storage.Client()
+    """Upload a file to GCS, verified with a CRC32C checksum. Returns the gs:// URL.
+
+    Files above PARALLEL_UPLOAD_THRESHOLD are split into parts that are
+    uploaded concurrently and assembled by GCS.
+    """
+    client = get_storage_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_path)
-    blob.upload_from_filename(str(local_path))
+    if local_path.stat().st_size > PARALLEL_UPLOAD_THRESHOLD:
+        transfer_manager.upload_chunks_concurrently(
+            str(local_path),
+            blob,
+            chunk_size=PARALLEL_UPLOAD_CHUNK_SIZE,
+            worker_type=transfer_manager.THREAD,
+            checksum="crc32c",
+        )
+    else:
+        blob.upload_from_filename(str(local_path), checksum="crc32c")
     url = f"gs://{bucket_name}/{blob_path}"
     print(f"Uploaded {local_path} to {url}")
     return url
@@ -223,11 +854,580 @@ def update_config_for_proxy(config_path: Path) -> None:
         yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
 
 
+def get_shard_info() -> tuple[int, int]:
+    """Return (task_index, task_count) for this Cloud Run task."""
+    task_index = int(os.environ.get("CLOUD_RUN_TASK_INDEX", "0"))
+    task_count = int(os.environ.get("CLOUD_RUN_TASK_COUNT", "1"))
+    return task_index, task_count
+
+
+def get_run_timestamp(task_count: int) -> str:
+    """Get the output folder timestamp. All shards of one execution must agree on it."""
+    timestamp = os.environ.get("RUN_TIMESTAMP")
+    if timestamp:
+        return timestamp
+    if task_count > 1 and os.environ.get("CLOUD_RUN_EXECUTION"):
+        return os.environ["CLOUD_RUN_EXECUTION"]
+    return datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+
+
+def shard_sample_budget(num_samples: int, task_index: int, task_count: int) -> int:
+    """Split num_samples across shards, giving the remainder to the first shards."""
+    base, extra = divmod(num_samples, task_count)
+    return base + (1 if task_index < extra else 0)
+
+
+def update_config_for_shard(config_path: Path, task_index: int, task_count: int) -> None:
+    """Limit the config's sample budget to this shard's slice."""
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+
+    output_config = config.get("output") or {}
+    num_samples = output_config.get("num_samples")
+    if not isinstance(num_samples, int):
+        print(f"Warning: output.num_samples is {num_samples!r}, not splitting it across shards")
+        return
+
+    shard_samples = shard_sample_budget(num_samples, task_index, task_count)
+    output_config["num_samples"] = shard_samples
+    print(f"Shard {task_index + 1}/{task_count}: {shard_samples} of {num_samples} samples")
+
+    with open(config_path, "w") as f:
+        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+
+
+def ensure_trailing_newline(path: Path) -> None:
+    """Append a newline to a non-empty file that lacks one, so shards concatenate cleanly."""
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def compose_blobs(bucket, sources: list, destination) -> None:
+    """Concatenate source blobs into destination server-side, in rounds past the compose limit."""
+    intermediates = []
+    round_num = 0
+    while len(sources) > GCS_COMPOSE_LIMIT:
+        next_sources = []
+        for start in range(0, len(sources), GCS_COMPOSE_LIMIT):
+            part_index = start // GCS_COMPOSE_LIMIT
+            part = bucket.blob(f"{destination.name}.compose-{round_num}-{part_index}")
+            part.compose(sources[start:start + GCS_COMPOSE_LIMIT])
+            next_sources.append(part)
+            intermediates.append(part)
+        sources = next_sources
+        round_num += 1
+
+    destination.compose(sources)
+    for part in intermediates:
+        part.delete()
+
+
+def mark_shard_complete(
+    bucket_name: str,
+    output_prefix: str,
+    task_index: int,
+    output_files: list[dict],
+) -> None:
+    """Record that this shard's outputs are uploaded, with per-file sample counts.
+
+    The marker is tagged with the execution, so a resumed run doesn't count
+    the earlier run's markers.
+    """
+    client = get_storage_client()
+    marker = f"{output_prefix}/shards/{task_index:04d}/{SHARD_SUCCESS_MARKER}"
+    samples = {f["filename"]: f.get("samples") for f in output_files}
+    blob = client.bucket(bucket_name).blob(marker)
+    blob.metadata = {"execution": os.environ.get("CLOUD_RUN_EXECUTION", "")}
+    blob.upload_from_string(json.dumps({"samples": samples}), content_type="application/json")
+
+
+def acquire_merge_lock(blob) -> int | None:
+    """Take the shard merge lock. Returns its generation, or None if it is held.
+
+    A lock is reclaimed when it belongs to another execution (an earlier run
+    this one resumes), to an earlier attempt of this task, or has been
+    "merging" for longer than MERGE_LOCK_LEASE.
+    """
+    owner = {
+        "execution": os.environ.get("CLOUD_RUN_EXECUTION", ""),
+        "task": os.environ.get("CLOUD_RUN_TASK_INDEX", "0"),
+        "attempt": os.environ.get("CLOUD_RUN_TASK_ATTEMPT", "0"),
+        "state": "merging",
+        "acquired_at": time.time(),
+    }
+    try:
+        blob.upload_from_string(json.dumps(owner), if_generation_match=0)
+        return blob.generation
+    except gcs_exceptions.PreconditionFailed:
+        pass
+
+    try:
+        blob.reload()
+        generation = blob.generation
+        lock = json.loads(blob.download_as_bytes(if_generation_match=generation) or b"{}")
+    except (gcs_exceptions.NotFound, gcs_exceptions.PreconditionFailed, ValueError):
+        print("Another shard is merging outputs")
+        return None
+
+    same_execution = lock.get("execution") == owner["execution"]
+    if same_execution and lock.get("state") == "merged":
+        print("Shard outputs are already merged")
+        return None
+    stale = (
+        not same_execution
+        or (lock.get("task") == owner["task"] and lock.get("attempt") != owner["attempt"])
+        or time.time() - lock.get("acquired_at", 0) > MERGE_LOCK_LEASE
+    )
+    if not stale:
+        print("Another shard is merging outputs")
+        return None
+
+    try:
+        blob.upload_from_string(json.dumps(owner), if_generation_match=generation)
+    except gcs_exceptions.PreconditionFailed:
+        print("Another shard is merging outputs")
+        return None
+    print(f"Reclaimed a stale merge lock from {lock.get('execution')} task {lock.get('task')}")
+    return blob.generation
+
+
+def merge_shard_outputs(
+    bucket_name: str,
+    output_prefix: str,
+    task_count: int,
+    filenames: list[str],
+) -> list[dict] | None:
+    """Compose every shard's outputs into single files once all shards are complete.
+
+    Returns the merged output files, or None when shards are still running or
+    another shard has already claimed the merge. The lock is released if the
+    merge fails, so a retry can take it over.
+    """
+    client = get_storage_client()
+    bucket = client.bucket(bucket_name)
+    shards_prefix = f"{output_prefix}/shards/"
+    execution = os.environ.get("CLOUD_RUN_EXECUTION", "")
+
+    names = set()
+    markers = []
+    for blob in client.list_blobs(bucket, prefix=shards_prefix):
+        names.add(blob.name)
+        if not blob.name.endswith(f"/{SHARD_SUCCESS_MARKER}"):
+            continue
+        # Markers from an earlier run of a resumed output folder don't count
+        if execution and (blob.metadata or {}).get("execution", execution) != execution:
+            continue
+        markers.append(blob)
+    completed = {blob.name[len(shards_prefix):].split("/")[0] for blob in markers}
+    if len(completed) < task_count:
+        print(f"{len(completed)}/{task_count} shards complete, leaving merge to the last shard")
+        return None
+
+    # Only one shard may merge; creating the lock fails if it already exists
+    lock = bucket.blob(f"{shards_prefix}{SHARD_MERGE_LOCK}")
+    lock_generation = acquire_merge_lock(lock)
+    if lock_generation is None:
+        return None
+
+    try:
+        shard_samples = {
+            blob.name[len(shards_prefix):].split("/")[0]: json.loads(
+                blob.download_as_bytes() or b"{}"
+            ).get("samples", {})
+            for blob in markers
+        }
+
+        merged = []
+        for filename in filenames:
+            # A shard that succeeded may have produced no file, e.g. with no samples
+            shards = [
+                f"{i:04d}"
+                for i in range(task_count)
+                if f"{shards_prefix}{i:04d}/{filename}" in names
+            ]
+            if not shards:
+                print(f"No shard produced {filename}, skipping merge")
+                continue
+            if len(shards) < task_count:
+                print(f"{task_count - len(shards)} shards have no {filename}, merging the rest")
+            sources = [bucket.blob(f"{shards_prefix}{shard}/{filename}") for shard in shards]
+            destination = bucket.blob(f"{output_prefix}/{filename}")
+            compose_blobs(bucket, sources, destination)
+            destination.reload()
+            url = f"gs://{bucket_name}/{destination.name}"
+            print(f"Merged {len(shards)} shards into {url}")
+            counts = [shard_samples.get(shard, {}).get(filename) for shard in shards]
+            merged.append({
+                "url": url,
+                "filename": filename,
+                "size_bytes": destination.size,
+                "samples": sum(counts) if None not in counts else None,
+            })
+    except Exception:
+        try:
+            lock.delete(if_generation_match=lock_generation)
+        except gcs_exceptions.GoogleAPICallError:
+            pass
+        raise
+
+    # Keep the lock as a record that this execution merged, so late shards skip it
+    try:
+        done = json.loads(lock.download_as_bytes(if_generation_match=lock_generation))
+        done["state"] = "merged"
+        lock.upload_from_string(json.dumps(done), if_generation_match=lock_generation)
+    except gcs_exceptions.GoogleAPICallError as e:
+        print(f"Warning: Could not mark the merge as done: {e}")
+    return merged
+
+
+class DatasetCheckpointer:
+    """Upload completed lines of a growing JSONL dataset to GCS in chunks.
+
+    Chunks and a manifest live under {prefix}/checkpoint/. The manifest is
+    rewritten after every chunk, so a run that is killed or times out keeps
+    every sample up to its last checkpoint and can be resumed from there.
+
+    When given, the topic graph the samples are generated from is uploaded
+    to topics_blob with the first checkpoint, so a resumed run can load the
+    same graph.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str,
+        local_path: Path,
+        interval: float,
+        topics_path: Path | None = None,
+        topics_blob: str | None = None,
+    ):
+        self._bucket = get_storage_client().bucket(bucket_name)
+        self._bucket_name = bucket_name
+        self._checkpoint_prefix = f"{prefix}/checkpoint"
+        self._local_path = local_path
+        self._interval = interval
+        self._topics_path = topics_path
+        self._topics_blob = topics_blob
+        self._offset = 0  # Bytes of the local file already uploaded
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.manifest = {"chunks": [], "samples": 0, "updated_at": None}
+
+    def load(self) -> int:
+        """Load an existing manifest (when resuming). Returns the checkpointed sample count."""
+        blob = self._bucket.blob(f"{self._checkpoint_prefix}/manifest.json")
+        try:
+            self.manifest = json.loads(blob.download_as_bytes())
+        except gcs_exceptions.NotFound:
+            return 0
+        print(
+            f"Resuming from checkpoint: {self.manifest['samples']} samples "
+            f"in {len(self.manifest['chunks'])} chunks"
+        )
+        return self.manifest["samples"]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="checkpointer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Warning: Checkpoint upload failed, retrying next interval: {e}")
+
+    def flush(self, final: bool = False) -> None:
+        """Upload lines appended since the last checkpoint.
+
+        Only newline-terminated lines are uploaded unless final is set, in
+        which case a trailing partial line is included and terminated.
+        """
+        with self._lock:
+            if not self._local_path.exists():
+                return
+            # deepfabric saves the whole graph before it writes any sample
+            if self._topics_path and self._topics_path.exists():
+                upload_to_gcs(self._topics_path, self._bucket_name, self._topics_blob)
+                self._topics_path = None
+            with open(self._local_path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+
+            consumed = len(data) if final else data.rfind(b"\n") + 1
+            data = data[:consumed]
+            if not data:
+                return
+            if not data.endswith(b"\n"):
+                data += b"\n"
+
+            chunk_index = len(self.manifest["chunks"])
+            chunk_name = f"{self._checkpoint_prefix}/chunks/{chunk_index:05d}.jsonl"
+            self._bucket.blob(chunk_name).upload_from_string(data, checksum="crc32c")
+
+            samples = data.count(b"\n")
+            self._offset += consumed
+            self.manifest["chunks"].append(
+                {"name": chunk_name, "samples": samples, "bytes": len(data)}
+            )
+            self.manifest["samples"] += samples
+            self.manifest["updated_at"] = datetime.utcnow().isoformat() + "Z"
+            self._bucket.blob(f"{self._checkpoint_prefix}/manifest.json").upload_from_string(
+                json.dumps(self.manifest, indent=2), content_type="application/json"
+            )
+            print(f"Checkpoint: {self.manifest['samples']} samples saved")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def finalize(self, blob_path: str, complete: bool = True) -> dict | None:
+        """Stop checkpointing, upload the remainder and compose all chunks into blob_path.
+
+        Returns a dict with the composed object's url and size_bytes, or None
+        if nothing was generated. A trailing partial line is only kept when the
+        run completed.
+        """
+        self.stop()
+        self.flush(final=complete)
+        if not self.manifest["chunks"]:
+            return None
+
+        destination = self._bucket.blob(blob_path)
+        sources = [self._bucket.blob(chunk["name"]) for chunk in self.manifest["chunks"]]
+        compose_blobs(self._bucket, sources, destination)
+        destination.reload()
+        url = f"gs://{self._bucket_name}/{blob_path}"
+        print(f"Composed {len(sources)} checkpoint chunks into {url}")
+        return {"url": url, "size_bytes": destination.size}
+
+
+def get_idle_timeout() -> float:
+    """Get seconds deepfabric may print nothing before it is killed. Default 3600, 0 disables."""
+    return float(os.environ.get("DEEPFABRIC_IDLE_TIMEOUT", str(DEFAULT_IDLE_TIMEOUT)))
+
+
+def get_checkpoint_interval() -> float:
+    """Get seconds between dataset checkpoint uploads from environment. Default 300, 0 disables."""
+    return float(os.environ.get("CHECKPOINT_INTERVAL", str(DEFAULT_CHECKPOINT_INTERVAL)))
+
+
+def update_config_for_resume(config_path: Path, completed_samples: int) -> int:
+    """Reduce the sample budget by samples already checkpointed. Returns the remaining count.
+
+    Raises RuntimeError if the budget isn't a plain count, since generating
+    it in full would duplicate the checkpointed samples.
+    """
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+
+    output_config = config.get("output") or {}
+    num_samples = output_config.get("num_samples")
+    if not isinstance(num_samples, int):
+        raise RuntimeError(
+            f"Cannot resume: output.num_samples is {num_samples!r}, so the "
+            f"{completed_samples} checkpointed samples can't be deducted from it"
+        )
+
+    remaining = max(num_samples - completed_samples, 0)
+    output_config["num_samples"] = remaining
+    print(f"Resume: {completed_samples} samples checkpointed, {remaining}/{num_samples} remaining")
+
+    with open(config_path, "w") as f:
+        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+    return remaining
+
+
+def count_lines(path: Path) -> int:
+    """Count newline-terminated lines (JSONL records) in a file without loading it."""
+    lines = 0
+    with open(path, "rb") as f:
+        while block := f.read(1024 * 1024):
+            lines += block.count(b"\n")
+    return lines
+
+
+def get_catalog_path(timestamp: str) -> str:
+    """Get the catalog shard for a run timestamp (YYYYMMDD-HHMMSS)."""
+    try:
+        month = datetime.strptime(timestamp, "%Y%m%d-%H%M%S").strftime("%Y-%m")
+    except ValueError:
+        month = datetime.utcnow().strftime("%Y-%m")
+    return f"{CATALOG_PREFIX}runs-{month}.jsonl"
+
+
+def append_to_catalog(bucket_name: str, record: dict) -> None:
+    """Append a run record to the bucket's output catalog.
+
+    The run's monthly shard is rewritten with a generation precondition, so
+    concurrent jobs appending at the same time retry instead of overwriting
+    each other.
+    """
+    catalog_path = get_catalog_path(record["timestamp"])
+    blob = get_storage_client().bucket(bucket_name).blob(catalog_path)
+    line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+    for attempt in range(CATALOG_WRITE_ATTEMPTS):
+        try:
+            blob.reload()
+            generation = blob.generation
+            existing = blob.download_as_bytes(if_generation_match=generation)
+        except gcs_exceptions.NotFound:
+            generation, existing = 0, b""
+        except gcs_exceptions.PreconditionFailed:
+            # Rewritten between reload and download; read it again
+            continue
+
+        try:
+            blob.upload_from_string(
+                existing + line,
+                content_type="application/x-ndjson",
+                if_generation_match=generation,
+            )
+            print(f"Recorded run in gs://{bucket_name}/{catalog_path}")
+            return
+        except gcs_exceptions.PreconditionFailed:
+            time.sleep(random.uniform(0.5, 2.0) * (attempt + 1))
+
+    print(f"Warning: Could not update output catalog after {CATALOG_WRITE_ATTEMPTS} attempts")
+
+
+def build_catalog_record(
+    job_name: str,
+    timestamp: str,
+    output_prefix: str,
+    output_files: list[dict],
+    dataset_file: str | None,
+    success: bool,
+    duration_seconds: float,
+) -> dict:
+    """Build the catalog record for a finished run."""
+    files = []
+    for f in output_files:
+        files.append({
+            "name": f["filename"],
+            "path": f["url"].split("/", 3)[3],
+            "kind": "dataset" if f["filename"] == dataset_file else "topics",
+            "size_bytes": f["size_bytes"],
+            "samples": f.get("samples"),
+        })
+    return {
+        "run": job_name,
+        "timestamp": timestamp,
+        "prefix": output_prefix,
+        "status": "success" if success else "failed",
+        "files": files,
+        "duration_seconds": round(duration_seconds, 1),
+        "execution": os.environ.get("CLOUD_RUN_EXECUTION"),
+        "created_at": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def upload_outputs(
+    work_path: Path,
+    filenames: list[str],
+    bucket_name: str,
+    upload_prefix: str,
+    checkpointer: DatasetCheckpointer | None = None,
+    dataset_file: str | None = None,
+    complete: bool = True,
+    sharded: bool = False,
+) -> list[dict]:
+    """Upload run outputs concurrently. Returns output file dicts, excluding the log.
+
+    The dataset is assembled from its checkpoint chunks when a checkpointer
+    is given; every other file is uploaded from the work directory.
+    """
+
+    def upload_one(filename: str) -> dict | None:
+        gcs_path = f"{upload_prefix}/{filename}"
+        if checkpointer and filename == dataset_file:
+            output_info = checkpointer.finalize(gcs_path, complete=complete)
+            if not output_info:
+                return None
+            return {
+                "url": output_info["url"],
+                "filename": filename,
+                "size_bytes": output_info["size_bytes"],
+                "samples": checkpointer.manifest["samples"],
+            }
+
+        local_output = work_path / filename
+        if not local_output.exists():
+            return None
+        if sharded and filename != LOG_FILE_NAME:
+            ensure_trailing_newline(local_output)
+        file_size = local_output.stat().st_size
+        url = upload_to_gcs(local_output, bucket_name, gcs_path)
+        samples = count_lines(local_output) if filename.endswith(".jsonl") else None
+        return {"url": url, "filename": filename, "size_bytes": file_size, "samples": samples}
+
+    with ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="upload") as pool:
+        results = list(pool.map(upload_one, filenames))
+
+    output_files = []
+    for filename, output_info in zip(filenames, results):
+        if output_info is None:
+            if filename != LOG_FILE_NAME:
+                print(f"Warning: Expected output {filename} not found")
+        elif filename != LOG_FILE_NAME:
+            output_files.append(output_info)
+    return output_files
+
+
 def get_progress_interval() -> int:
     """Get Slack progress update interval from environment. Default 900 seconds (15 min)."""
     return int(os.environ.get("PROGRESS_INTERVAL", "900"))
 
 
+def get_dataset_file_from_config(config_path: Path) -> str | None:
+    """Extract the dataset output path (output.save_as) from config."""
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+
+    if "output" in config and "save_as" in config["output"]:
+        return config["output"]["save_as"]
+    return None
+
+
+def get_topics_file_from_config(config_path: Path) -> str | None:
+    """Extract the topic graph output path (topics.save_as) from config."""
+    with open(config_path, "r") as f:
+        config = yaml.safe_load(f)
+
+    return (config.get("topics") or {}).get("save_as")
+
+
+def get_resume_topics_path(bucket_name: str, prefix: str, config_path: Path) -> str | None:
+    """Find the topic graph a resumed run's checkpointed samples were generated from.
+
+    Returns its GCS path, or None if the config saves no graph or nothing was
+    checkpointed yet. Raises RuntimeError if samples were checkpointed but
+    their graph wasn't saved, since a new graph wouldn't match them.
+    """
+    topics_file = get_topics_file_from_config(config_path)
+    if not topics_file:
+        return None
+
+    bucket = get_storage_client().bucket(bucket_name)
+    topics_path = f"{prefix}/{topics_file}"
+    if bucket.blob(topics_path).exists():
+        return topics_path
+    if bucket.blob(f"{prefix}/checkpoint/manifest.json").exists():
+        raise RuntimeError(
+            f"Cannot resume: gs://{bucket_name}/{topics_path}, the topic graph of the "
+            "checkpointed samples, was not saved. Resubmit with --topics-load naming the graph."
+        )
+    return None
+
+
 def get_output_files_from_config(
     config_path: Path,
     topic_only: bool = False,
@@ -246,12 +1446,134 @@ def get_output_files_from_config(
 
     # Dataset output - only when generating dataset (not topic-only)
     if not topic_only:
-        if "output" in config and "save_as" in config["output"]:
-            outputs.append(config["output"]["save_as"])
+        dataset_file = get_dataset_file_from_config(config_path)
+        if dataset_file:
+            outputs.append(dataset_file)
 
     return outputs
 
 
+def parse_retry_after(value: str | None, default: float) -> float:
+    """Seconds to wait from a Retry-After header, in seconds or as an HTTP date."""
+    if not value:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return seconds if seconds >= 0 else default  # Also rejects NaN
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        return default
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class SlackNotifier:
+    """Sends Slack webhook messages from a background thread.
+
+    Messages are queued so callers, such as the loop draining deepfabric's
+    output, never wait on Slack. A new progress update replaces one that is
+    still queued, and 429/5xx responses are retried with backoff.
+    """
+
+    def __init__(self, webhook_url: str, max_queue: int = SLACK_QUEUE_SIZE):
+        self.webhook_url = webhook_url
+        self.max_queue = max_queue
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._session = requests.Session()
+        self._thread = threading.Thread(target=self._run, name="slack-notifier", daemon=True)
+        self._thread.start()
+
+    def send(self, payload: dict, description: str, progress: bool = False) -> None:
+        """Queue a message. Progress messages replace an unsent progress message."""
+        with self._cond:
+            if self._closed:
+                return
+            if progress:
+                self._queue = deque(m for m in self._queue if not m[2])
+            if len(self._queue) >= self.max_queue:
+                print(f"Warning: Slack queue full, dropping {description}")
+                return
+            self._queue.append((payload, description, progress))
+            self._cond.notify()
+
+    def flush(self, timeout: float = SLACK_FLUSH_TIMEOUT) -> None:
+        """Wait for queued messages to be sent, then stop the sender thread."""
+        deadline = time.time() + timeout
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            while (self._queue or self._busy) and time.time() < deadline:
+                self._cond.wait(deadline - time.time())
+            if self._queue:
+                print(f"Warning: {len(self._queue)} Slack messages not sent before exit")
+                self._queue.clear()
+        self._thread.join(max(deadline - time.time(), 0))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                payload, description, _ = self._queue.popleft()
+                self._busy = True
+            try:
+                self._post(payload, description)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _post(self, payload: dict, description: str) -> None:
+        delay = 1.0
+        for attempt in range(1, SLACK_MAX_ATTEMPTS + 1):
+            try:
+                response = self._session.post(self.webhook_url, json=payload, timeout=30)
+            except requests.RequestException as e:
+                error, wait = str(e), delay
+            else:
+                if response.status_code == 429 or response.status_code >= 500:
+                    # Slack sends Retry-After with rate limit responses
+                    error = f"HTTP {response.status_code}"
+                    wait = parse_retry_after(response.headers.get("Retry-After"), delay)
+                elif response.ok:
+                    print(f"Slack {description} sent")
+                    return
+                else:
+                    error = f"HTTP {response.status_code}"
+                    print(f"Warning: Failed to send Slack {description}: {error}")
+                    return
+            if attempt == SLACK_MAX_ATTEMPTS:
+                print(f"Warning: Failed to send Slack {description}: {error}")
+                return
+            time.sleep(min(wait, SLACK_MAX_BACKOFF))
+            delay *= 2
+
+
+def get_slack_notifier(webhook_url: str) -> SlackNotifier:
+    """Get the shared Slack notifier, creating it on first use."""
+    global _slack_notifier
+    with _slack_notifier_lock:
+        if _slack_notifier is None:
+            _slack_notifier = SlackNotifier(webhook_url)
+        return _slack_notifier
+
+
+def flush_slack_notifications() -> None:
+    """Send any queued Slack messages before the job exits."""
+    if _slack_notifier is not None:
+        _slack_notifier.flush()
+
+
 def send_slack_notification(
     webhook_url: str,
     job_name: str,
@@ -330,13 +1652,7 @@ def send_slack_notification(
     )
 
     payload = {"blocks": blocks, "attachments": [{"color": color, "blocks": []}]}
-
-    try:
-        response = requests.post(webhook_url, json=payload, timeout=30)
-        response.raise_for_status()
-        print("Slack notification sent successfully")
-    except Exception as e:
-        print(f"Warning: Failed to send Slack notification: {e}")
+    get_slack_notifier(webhook_url).send(payload, "notification")
 
 
 def send_job_started_notification(
@@ -373,13 +1689,7 @@ def send_job_started_notification(
     ]
 
     payload = {"blocks": blocks, "attachments": [{"color": "#3498db", "blocks": []}]}
-
-    try:
-        response = requests.post(webhook_url, json=payload, timeout=30)
-        response.raise_for_status()
-        print("Job started notification sent")
-    except Exception as e:
-        print(f"Warning: Failed to send job started notification: {e}")
+    get_slack_notifier(webhook_url).send(payload, "job started notification")
 
 
 def get_identity_token(audience: str) -> str | None:
@@ -489,6 +1799,156 @@ def run_import_tools(spin_endpoint: str, mcp_command: str = "npx dataforseo-mcp-
             pass
 
 
+class ProgressTracker:
+    """Structured progress of a deepfabric run, parsed from its output line by line.
+
+    Tracks samples, throughput over the last PROGRESS_RATE_WINDOW seconds,
+    ETA, error lines and tool call latency (recorded by the auth proxy).
+    When started, a background thread uploads a snapshot to GCS every
+    interval for `dfcloud status` to read.
+    """
+
+    def __init__(self, base_samples: int = 0):
+        self.base_samples = base_samples  # Samples already done before a resume
+        self.started_at = time.time()
+        self._samples = None
+        self._total = None
+        self._points = deque()  # (time, samples) within the rate window
+        self._errors = 0
+        self._last_error = None
+        self._lines = 0
+        self._latencies = deque(maxlen=PROGRESS_LATENCY_SAMPLES)
+        self._tool_calls = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._blob = None
+        self._extra = {}
+        self._state = "running"
+
+    def feed(self, lines: list[str]) -> None:
+        """Parse a batch of output lines."""
+        now = time.time()
+        with self._lock:
+            for line in lines:
+                self._lines += 1
+                match = SAMPLES_PATTERN.search(line)
+                if match:
+                    self._samples = int(match.group(1))
+                    self._total = int(match.group(2))
+                    self._points.append((now, self._samples))
+                elif ERROR_PATTERN.search(line):
+                    self._errors += 1
+                    self._last_error = line[-300:]
+            while len(self._points) > 2 and now - self._points[0][0] > PROGRESS_RATE_WINDOW:
+                self._points.popleft()
+
+    def record_tool_call(self, seconds: float) -> None:
+        with self._lock:
+            self._tool_calls += 1
+            self._latencies.append(seconds)
+
+    def summary(self) -> str | None:
+        """One-line progress for Slack, or None before any samples were reported."""
+        snapshot = self.snapshot()
+        samples = snapshot["samples"]
+        if samples["done"] is None:
+            return None
+        text = f"Samples: {samples['done']}/{samples['total']} ({samples['percent']:.1f}%)"
+        if snapshot["rate_per_second"]:
+            text += f", {snapshot['rate_per_second'] * 60:.1f}/min"
+        if snapshot["eta_seconds"] is not None:
+            text += f", ETA {snapshot['eta_seconds'] / 60:.0f} min"
+        return text
+
+    def snapshot(self) -> dict:
+        """Current progress as a JSON-serializable dict."""
+        now = time.time()
+        with self._lock:
+            done = total = percent = rate = eta = None
+            if self._samples is not None:
+                done = self._samples + self.base_samples
+                total = self._total + self.base_samples
+                percent = done / total * 100 if total else 100.0
+            if len(self._points) > 1:
+                (t0, s0), (t1, s1) = self._points[0], self._points[-1]
+                rate = (s1 - s0) / (t1 - t0) if t1 > t0 else None
+            if rate and total is not None:
+                eta = (total - done) / rate
+            latencies = sorted(self._latencies)
+            tool_calls = {"count": self._tool_calls}
+            for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+                tool_calls[f"{name}_ms"] = (
+                    round(latencies[min(int(q * len(latencies)), len(latencies) - 1)] * 1000, 1)
+                    if latencies
+                    else None
+                )
+            snapshot = {
+                "state": self._state,
+                "samples": {"done": done, "total": total, "percent": percent},
+                "rate_per_second": rate,
+                "eta_seconds": eta,
+                "errors": {"count": self._errors, "last": self._last_error},
+                "lines": self._lines,
+                "tool_calls": tool_calls,
+                "elapsed_seconds": now - self.started_at,
+                "updated_at": datetime.utcnow().isoformat() + "Z",
+            }
+        snapshot["proxy"] = {
+            "tools_cache": dict(_tools_cache.stats) if _tools_cache else None,
+            "execute_cache": dict(_execute_cache.stats) if _execute_cache else None,
+        }
+        return snapshot
+
+    def start(self, bucket_name: str, blob_path: str, interval: float, extra: dict) -> None:
+        """Upload snapshots (merged with `extra`) to GCS every interval seconds."""
+        self._blob = get_storage_client().bucket(bucket_name).blob(blob_path)
+        self._blob.cache_control = "no-store"
+        self._extra = extra
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="progress", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.upload()
+            except Exception as e:
+                print(f"Warning: Progress status upload failed: {e}")
+
+    def upload(self) -> None:
+        if self._blob is None:
+            return
+        status = {**self._extra, **self.snapshot()}
+        self._blob.upload_from_string(json.dumps(status), content_type="application/json")
+
+    def stop(self, state: str) -> None:
+        """Stop periodic uploads and write the final status."""
+        with self._lock:
+            self._state = state
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        try:
+            self.upload()
+        except Exception as e:
+            print(f"Warning: Progress status upload failed: {e}")
+
+
+def get_progress_status_interval() -> float:
+    """Get seconds between progress status uploads from environment. Default 30, 0 disables."""
+    return float(
+        os.environ.get("PROGRESS_STATUS_INTERVAL", str(DEFAULT_PROGRESS_STATUS_INTERVAL))
+    )
+
+
+def get_progress_status_path(job_name: str, task_index: int) -> str:
+    """GCS path of this task's progress status object."""
+    execution = os.environ.get("CLOUD_RUN_EXECUTION") or job_name
+    return f"{PROGRESS_STATUS_PREFIX}/{execution}/task-{task_index:04d}.json"
+
+
 def run_deepfabric(
     config_path: Path,
     work_dir: Path,
@@ -497,8 +1957,16 @@ def run_deepfabric(
     slack_webhook_url: str | None = None,
     job_name: str | None = None,
     progress_interval: int = 900,
+    log_path: Path | None = None,
+    progress_tracker: ProgressTracker | None = None,
 ) -> tuple[bool, str]:
-    """Run deepfabric generate command with streaming output. Returns (success, output/error)."""
+    """Run deepfabric generate command with streaming output. Returns (success, output/error).
+
+    Only the last LOG_TAIL_LINES lines are kept in memory and returned; the
+    full output is written gzip-compressed to log_path when given. The
+    process is killed after DEEPFABRIC_TIMEOUT seconds, or after
+    DEEPFABRIC_IDLE_TIMEOUT seconds without output, even while it is silent.
+    """
     cmd = ["deepfabric", "generate", str(config_path), "--tui", "simple"]
 
     if topic_only:
@@ -511,8 +1979,10 @@ def run_deepfabric(
     sys.stdout.flush()
 
     timeout_seconds = int(get_env("DEEPFABRIC_TIMEOUT", required=False) or 86400)
-    output_lines = []
+    idle_timeout = get_idle_timeout()
+    output_lines = deque(maxlen=LOG_TAIL_LINES)
     last_progress_update = time.time()
+    log_file = gzip.open(log_path, "wt", encoding="utf-8") if log_path else None
 
     try:
         process = subprocess.Popen(
@@ -525,27 +1995,52 @@ def run_deepfabric(
         )
 
         start_time = time.time()
+        last_output_at = start_time
 
-        # Stream output in real-time
-        for line in process.stdout:
-            line = line.rstrip()
-            print(line)
-            sys.stdout.flush()
-            output_lines.append(line)
+        # Drain the pipe on its own thread so a hung process can't block the
+        # timeout checks below, and slow forwarding can't fill the pipe
+        lines_queue = queue.Queue(maxsize=OUTPUT_QUEUE_SIZE)
+        reader = threading.Thread(
+            target=_read_output, args=(process.stdout, lines_queue), daemon=True
+        )
+        reader.start()
+
+        eof = False
+        while not eof:
+            batch, eof = _next_output_batch(lines_queue, OUTPUT_FLUSH_INTERVAL)
+            now = time.time()
+
+            # Forward output in one write per batch
+            if batch:
+                last_output_at = now
+                output_lines.extend(batch)
+                text = "\n".join(batch) + "\n"
+                sys.stdout.write(text)
+                sys.stdout.flush()
+                if log_file:
+                    log_file.write(text)
+                if progress_tracker:
+                    progress_tracker.feed(batch)
 
             # Check for timeout
-            if time.time() - start_time > timeout_seconds:
+            if now - start_time > timeout_seconds:
                 process.kill()
+                process.wait()  # Reap it rather than leave a zombie
                 return False, f"Job timed out after {timeout_seconds} seconds"
+            if idle_timeout and now - last_output_at > idle_timeout:
+                process.kill()
+                process.wait()  # Reap it rather than leave a zombie
+                return False, f"deepfabric printed nothing for {idle_timeout:.0f} seconds"
 
             # Send periodic Slack progress updates
             if slack_webhook_url and job_name:
-                if time.time() - last_progress_update > progress_interval:
-                    # Look for progress info in recent lines
-                    progress_info = _extract_progress(output_lines[-20:])
+                if now - last_progress_update > progress_interval:
+                    # Prefer parsed progress; fall back to recent lines (e.g. topic generation)
+                    progress_info = progress_tracker.summary() if progress_tracker else None
+                    progress_info = progress_info or _extract_progress(list(output_lines)[-20:])
                     if progress_info:
                         _send_progress_update(slack_webhook_url, job_name, progress_info)
-                    last_progress_update = time.time()
+                    last_progress_update = now
 
         process.wait()
 
@@ -556,12 +2051,38 @@ def run_deepfabric(
 
     except Exception as e:
         return False, str(e)
+    finally:
+        if log_file:
+            log_file.close()
+
+
+def _read_output(stream, lines_queue: queue.Queue) -> None:
+    """Put each line of a process's output on a queue, then None at EOF."""
+    try:
+        for line in stream:
+            lines_queue.put(line.rstrip())
+    finally:
+        lines_queue.put(None)
+
+
+def _next_output_batch(lines_queue: queue.Queue, wait: float) -> tuple[list[str], bool]:
+    """Wait up to `wait` seconds for output, then take everything queued.
+
+    Returns the lines and whether the end of output was reached.
+    """
+    batch = []
+    try:
+        line = lines_queue.get(timeout=wait)
+        while line is not None:
+            batch.append(line)
+            line = lines_queue.get_nowait()
+        return batch, True
+    except queue.Empty:
+        return batch, False
 
 
 def _extract_progress(lines: list[str]) -> str | None:
     """Extract progress information from recent log lines."""
-    import re
-
     # Look for deepfabric --tui simple output patterns
     for line in reversed(lines):
         # Dataset generation: "Step 244: +4 (total 976/10000)"
@@ -592,10 +2113,7 @@ def _send_progress_update(webhook_url: str, job_name: str, progress: str) -> Non
             }
         ]
     }
-    try:
-        requests.post(webhook_url, json=payload, timeout=10)
-    except Exception:
-        pass  # Don't fail the job for notification errors
+    get_slack_notifier(webhook_url).send(payload, "progress update", progress=True)
 
 
 def run_import_tools_mode():
@@ -640,6 +2158,7 @@ def run_import_tools_mode():
 
 def run_generate_mode():
     """Run generate mode: download config, run deepfabric, upload outputs."""
+    global _progress_tracker
     start_time = time.time()
 
     # Get configuration from environment
@@ -653,6 +2172,14 @@ def run_generate_mode():
     topic_only = get_env("TOPIC_ONLY", required=False) == "true"
     topics_load_gcs = get_env("TOPICS_LOAD", required=False)  # GCS path to existing graph
 
+    # Output prefix of an earlier run to continue, e.g. "outputs/my-job/20240115-120000"
+    resume_from = (get_env("RESUME_FROM", required=False) or "").rstrip("/")
+
+    # Cloud Run sets these for each task of a multi-task (sharded) execution
+    task_index, task_count = get_shard_info()
+    sharded = task_count > 1
+    notify_name = f"{job_name} [shard {task_index + 1}/{task_count}]" if sharded else job_name
+
     print("=== Generate Mode ===")
     print(f"Job: {job_name}")
     print(f"Config: gs://{gcs_bucket}/{config_path}")
@@ -661,6 +2188,14 @@ def run_generate_mode():
         print("Mode: Topic graph generation only (--topic-only)")
     elif topics_load_gcs:
         print(f"Mode: Dataset generation with existing graph (--topics-load {topics_load_gcs})")
+    if sharded:
+        print(f"Shard: {task_index + 1}/{task_count}")
+    if resume_from:
+        print(f"Resuming: gs://{gcs_bucket}/{resume_from}")
+
+    # Fix the output location up front so checkpoints and final outputs share it
+    output_prefix = resume_from or f"outputs/{job_name}/{get_run_timestamp(task_count)}"
+    upload_prefix = f"{output_prefix}/shards/{task_index:04d}" if sharded else output_prefix
 
     # Create working directory
     with tempfile.TemporaryDirectory() as work_dir:
@@ -680,6 +2215,17 @@ def run_generate_mode():
             # Ensure config uses localhost:3000 (proxied to Spin)
             update_config_for_proxy(local_config)
 
+            # Generate only this shard's slice of the sample budget
+            if sharded:
+                update_config_for_shard(local_config, task_index, task_count)
+
+            # A resumed run loads the graph its checkpointed samples came from
+            # rather than building a new one and uploading it over that graph
+            if resume_from and not topic_only and not topics_load_gcs:
+                topics_load_gcs = get_resume_topics_path(gcs_bucket, upload_prefix, local_config)
+                if topics_load_gcs:
+                    print(f"Resume: loading topic graph gs://{gcs_bucket}/{topics_load_gcs}")
+
             # Download existing topic graph if specified
             if topics_load_gcs:
                 local_topics_path = str(work_path / "topics.jsonl")
@@ -693,6 +2239,28 @@ def run_generate_mode():
             )
             print(f"Expected outputs: {expected_outputs}")
 
+            # Checkpoint the dataset as it grows so a killed run can be resumed
+            checkpointer = None
+            dataset_file = None if topic_only else get_dataset_file_from_config(local_config)
+            checkpoint_interval = get_checkpoint_interval()
+            remaining_samples = None
+            if dataset_file and (checkpoint_interval > 0 or resume_from):
+                topics_file = None if topics_load_gcs else get_topics_file_from_config(local_config)
+                checkpointer = DatasetCheckpointer(
+                    gcs_bucket,
+                    upload_prefix,
+                    work_path / dataset_file,
+                    interval=checkpoint_interval or DEFAULT_CHECKPOINT_INTERVAL,
+                    topics_path=work_path / topics_file if topics_file else None,
+                    topics_blob=f"{upload_prefix}/{topics_file}" if topics_file else None,
+                )
+                if resume_from:
+                    completed_samples = checkpointer.load()
+                    if completed_samples:
+                        remaining_samples = update_config_for_resume(
+                            local_config, completed_samples
+                        )
+
             # Get progress interval from environment (default 900 seconds / 15 min)
             progress_interval = get_progress_interval()
             print(f"Slack progress interval: {progress_interval} seconds")
@@ -704,9 +2272,11 @@ def run_generate_mode():
                 mode = "Dataset generation (with existing topics)"
             else:
                 mode = "Full pipeline (topics + dataset)"
+            if sharded:
+                mode = f"{mode} across {task_count} shards"
 
-            # Send job started notification
-            if slack_webhook_url:
+            # Send job started notification (once per execution)
+            if slack_webhook_url and task_index == 0:
                 send_job_started_notification(
                     webhook_url=slack_webhook_url,
                     job_name=job_name,
@@ -715,42 +2285,93 @@ def run_generate_mode():
                 )
 
             # Run deepfabric
-            success, output = run_deepfabric(
-                local_config,
+            if remaining_samples == 0:
+                print("All samples already checkpointed, skipping generation")
+                success, output = True, ""
+            else:
+                if checkpointer:
+                    checkpointer.start()
+
+                # Publish live progress for `dfcloud status`
+                base_samples = checkpointer.manifest["samples"] if remaining_samples else 0
+                _progress_tracker = ProgressTracker(base_samples=base_samples)
+                status_interval = get_progress_status_interval()
+                if status_interval > 0:
+                    _progress_tracker.start(
+                        gcs_bucket,
+                        get_progress_status_path(job_name, task_index),
+                        status_interval,
+                        extra={
+                            "job_name": job_name,
+                            "output_prefix": output_prefix,
+                            "task_index": task_index,
+                            "task_count": task_count,
+                        },
+                    )
+
+                success, output = run_deepfabric(
+                    local_config,
+                    work_path,
+                    topic_only=topic_only,
+                    topics_load=local_topics_path,
+                    slack_webhook_url=slack_webhook_url,
+                    job_name=job_name,
+                    progress_interval=progress_interval,
+                    log_path=work_path / LOG_FILE_NAME,
+                    progress_tracker=_progress_tracker,
+                )
+                _progress_tracker.stop("succeeded" if success else "failed")
+                print_proxy_stats()
+
+            # Upload outputs and the full (compressed) deepfabric log to GCS
+            output_files = upload_outputs(
                 work_path,
-                topic_only=topic_only,
-                topics_load=local_topics_path,
-                slack_webhook_url=slack_webhook_url,
-                job_name=job_name,
-                progress_interval=progress_interval,
+                expected_outputs + [LOG_FILE_NAME],
+                gcs_bucket,
+                upload_prefix,
+                checkpointer=checkpointer,
+                dataset_file=dataset_file,
+                complete=success,
+                sharded=sharded,
             )
 
-            # Upload outputs to GCS
-            output_files = []
-            timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-            output_prefix = f"outputs/{job_name}/{timestamp}"
-
-            for output_file in expected_outputs:
-                local_output = work_path / output_file
-                if local_output.exists():
-                    gcs_path = f"{output_prefix}/{output_file}"
-                    file_size = local_output.stat().st_size
-                    url = upload_to_gcs(local_output, gcs_bucket, gcs_path)
-                    output_files.append({
-                        "url": url,
-                        "filename": output_file,
-                        "size_bytes": file_size,
-                    })
-                else:
-                    print(f"Warning: Expected output {output_file} not found")
+            # The last shard to finish merges the dataset shards into one file
+            if sharded and success:
+                mark_shard_complete(gcs_bucket, output_prefix, task_index, output_files)
+                merge_files = [f for f in expected_outputs if f == dataset_file]
+                merged_files = merge_shard_outputs(
+                    gcs_bucket, output_prefix, task_count, merge_files
+                )
+                if merged_files is None:
+                    print(f"Shard {task_index + 1}/{task_count} completed successfully")
+                    return
+                output_files = merged_files
+                notify_name = job_name
 
             # Calculate duration
             duration = time.time() - start_time
 
+            # Index the run so the CLI can find its outputs without listing the bucket
+            try:
+                append_to_catalog(
+                    gcs_bucket,
+                    build_catalog_record(
+                        job_name,
+                        output_prefix.rsplit("/", 1)[-1],
+                        output_prefix,
+                        output_files,
+                        dataset_file,
+                        success,
+                        duration,
+                    ),
+                )
+            except Exception as e:
+                print(f"Warning: Failed to update output catalog: {e}")
+
             # Send notification
             send_slack_notification(
                 webhook_url=slack_webhook_url,
-                job_name=job_name,
+                job_name=notify_name,
                 status="success" if success else "failed",
                 duration_seconds=duration,
                 output_files=output_files,
@@ -770,7 +2391,7 @@ def run_generate_mode():
 
             send_slack_notification(
                 webhook_url=slack_webhook_url,
-                job_name=job_name,
+                job_name=notify_name,
                 status="failed",
                 duration_seconds=duration,
                 output_files=[],
@@ -784,14 +2405,17 @@ def main():
     """Main entrypoint - dispatch based on JOB_MODE."""
     job_mode = get_env("JOB_MODE", required=False) or "generate"
 
-    if job_mode == "import-tools":
-        run_import_tools_mode()
-    elif job_mode == "generate":
-        run_generate_mode()
-    else:
-        print(f"Unknown JOB_MODE: {job_mode}")
-        print("Valid modes: import-tools, generate")
-        sys.exit(1)
+    try:
+        if job_mode == "import-tools":
+            run_import_tools_mode()
+        elif job_mode == "generate":
+            run_generate_mode()
+        else:
+            print(f"Unknown JOB_MODE: {job_mode}")
+            print("Valid modes: import-tools, generate")
+            sys.exit(1)
+    finally:
+        flush_slack_notifications()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Local Spin stand-in
+
+Serves the Spin mock endpoints the generate job and `dfcloud init` use, from
+memory, so the auth proxy and the init loaders can be exercised without a
+Spin deployment:
+
+    GET  /mock/list-tools       Tool schemas (ETag / If-None-Match supported)
+    POST /mock/load-schema      Replace tool schemas: {"tools": [...]}
+    POST /mock/update-response  Set a tool's default response: {"name", "mockResponse"}
+    POST /mock/add-fixture      Append a fixture: {"name", "match", "response"}
+    POST /mock/execute          Run a tool: {"name", "arguments"}
+    GET  /vfs/health            Health check
+
+/mock/execute returns the most specific fixture whose `match` values all
+equal the call's arguments (the latest added among equals), else the tool's
+default response. As in Spin, nothing can be unloaded: re-adding a fixture
+appends it again, so restart the stand-in before `dfcloud init --full`.
+
+Usage:
+    python local_spin.py --mock-data mock-data.json
+    python local_spin.py --mock-data mock-data.json --port 8080 --latency 0.2 --jitter 0.05
+
+    # Point the CLI at it; init needs no token or bucket for it
+    dfcloud config set spin_service_url http://127.0.0.1:8080
+    dfcloud init --skip-import-tools --mock-data mock-data.json
+
+    # Point a job run at it. The auth proxy sends no identity token to a local
+    # endpoint, but the job still downloads its config from and uploads its
+    # outputs to GCS, so it needs GCS credentials and its usual environment.
+    SPIN_ENDPOINT=http://127.0.0.1:8080 GCS_BUCKET=... CONFIG_PATH=... JOB_NAME=... \
+        python entrypoint.py
+"""
+
+import argparse
+import hashlib
+import http.server
+import json
+import random
+import threading
+import time
+
+
+class MockStore:
+    """Tool schemas, default responses and fixtures, shared by all handler threads."""
+
+    def __init__(self):
+        self.tools = []
+        self.responses = {}
+        self.fixtures = {}
+        self.etag = None
+        self.lock = threading.Lock()
+        self._update_etag()
+
+    def load_mock_data(self, mock_data: dict) -> None:
+        """Load the same mock-data.json that `dfcloud init` pushes to Spin."""
+        with self.lock:
+            if "tools" in mock_data:
+                self.tools = list(mock_data["tools"])
+                self._update_etag()
+            for name, data in mock_data.get("mockResponses", {}).items():
+                if data.get("defaultResponse"):
+                    self.responses[name] = data["defaultResponse"]
+            for name, fixtures in mock_data.get("fixtures", {}).items():
+                for fixture in fixtures:
+                    if fixture.get("match") and fixture.get("response"):
+                        self._add_fixture(name, fixture["match"], fixture["response"])
+
+    def load_schema(self, tools: list[dict]) -> int:
+        with self.lock:
+            self.tools = list(tools)
+            self._update_etag()
+            return len(self.tools)
+
+    def update_response(self, name: str, response) -> None:
+        with self.lock:
+            self.responses[name] = response
+
+    def add_fixture(self, name: str, match: dict, response) -> None:
+        with self.lock:
+            self._add_fixture(name, match, response)
+
+    def execute(self, name: str, arguments: dict):
+        """Return the response for a tool call, or None for an unknown tool."""
+        with self.lock:
+            best = None
+            for match, response in self.fixtures.get(name, []):
+                if all(arguments.get(k) == v for k, v in match.items()):
+                    if best is None or len(match) >= len(best[0]):
+                        best = (match, response)
+            if best:
+                return best[1]
+            if name in self.responses:
+                return self.responses[name]
+            if any(tool.get("name") == name for tool in self.tools):
+                return {"result": f"Mock response for {name}", "arguments": arguments}
+            return None
+
+    def _add_fixture(self, name: str, match: dict, response) -> None:
+        # Like Spin, fixtures are only ever appended, even with a match that
+        # is already loaded; execute prefers the later of equally specific ones
+        self.fixtures.setdefault(name, []).append((match, response))
+
+    def _update_etag(self) -> None:
+        digest = hashlib.sha256(json.dumps(self.tools, sort_keys=True).encode()).hexdigest()
+        self.etag = f'"{digest[:32]}"'
+
+
+class LocalSpinHandler(http.server.BaseHTTPRequestHandler):
+    """Request handler for the Spin mock endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    store = MockStore()
+    latency = 0.0
+    jitter = 0.0
+    quiet = False
+
+    def do_GET(self):
+        self._delay()
+        if self.path.startswith("/vfs/health"):
+            self._send_json(200, {"status": "ok"})
+        elif self.path.startswith("/mock/list-tools"):
+            etag = self.store.etag
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            with self.store.lock:
+                body = {"tools": self.store.tools}
+            self._send_json(200, body, {"ETag": etag})
+        else:
+            self._send_json(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self):
+        content_length = int(self.headers.get("Content-Length", 0))
+        try:
+            body = json.loads(self.rfile.read(content_length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "Invalid JSON"})
+            return
+
+        self._delay()
+        path = self.path.split("?")[0]
+        if path == "/mock/execute":
+            response = self.store.execute(body.get("name", ""), body.get("arguments") or {})
+            if response is None:
+                self._send_json(404, {"error": f"Unknown tool: {body.get('name')}"})
+            else:
+                self._send_json(200, response)
+        elif path == "/mock/load-schema":
+            loaded = self.store.load_schema(body.get("tools", []))
+            self._send_json(200, {"loaded": loaded})
+        elif path == "/mock/update-response":
+            if not body.get("name"):
+                self._send_json(400, {"error": "name is required"})
+                return
+            self.store.update_response(body["name"], body.get("mockResponse"))
+            self._send_json(200, {"updated": body["name"]})
+        elif path == "/mock/add-fixture":
+            if not body.get("name") or not isinstance(body.get("match"), dict):
+                self._send_json(400, {"error": "name and match are required"})
+                return
+            self.store.add_fixture(body["name"], body["match"], body.get("response"))
+            self._send_json(200, {"added": body["name"]})
+        else:
+            self._send_json(404, {"error": f"Not found: {self.path}"})
+
+    def _delay(self) -> None:
+        """Simulate network and service latency."""
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _send_json(self, status: int, body, headers: dict | None = None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local Spin stand-in")
+    parser.add_argument("--mock-data", help="mock-data.json to load at startup")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds of latency")
+    parser.add_argument("--quiet", action="store_true", help="Don't log each request")
+    args = parser.parse_args()
+
+    LocalSpinHandler.latency = args.latency
+    LocalSpinHandler.jitter = args.jitter
+    LocalSpinHandler.quiet = args.quiet
+
+    if args.mock_data:
+        with open(args.mock_data) as f:
+            LocalSpinHandler.store.load_mock_data(json.load(f))
+        store = LocalSpinHandler.store
+        fixtures = sum(len(f) for f in store.fixtures.values())
+        print(
+            f"Loaded {len(store.tools)} tools, {len(store.responses)} responses, "
+            f"{fixtures} fixtures from {args.mock_data}"
+        )
+
+    server = http.server.ThreadingHTTPServer((args.host, args.port), LocalSpinHandler)
+    print(f"Local Spin listening on http://{args.host}:{server.server_address[1]}")
+    print(f"Latency: {args.latency * 1000:.0f} ms +/- {args.jitter * 1000:.0f} ms")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()